@@ -9,6 +9,7 @@ import logging
 from typing import Dict, Optional
 from groq import Groq
 from dotenv import load_dotenv
+import hashlib
 import json
 import time
 
@@ -143,7 +144,8 @@ Structure the output with these exact sections in order:
                 ],
                 max_tokens=4000,
                 temperature=0.3,  # Lower temperature for more consistent results
-                top_p=0.9
+                top_p=0.9,
+                extra_body=self._prefix_cache_extra_body(resume_text)
             )
             
             tailored_resume = response.choices[0].message.content.strip()
@@ -194,8 +196,17 @@ Structure the output with these exact sections in order:
         if focus_areas:
             focus_instruction = f"\nPay special attention to highlighting: {', '.join(focus_areas)}"
         
+        # The resume block is placed before the job description so repeated
+        # calls with the same resume share a stable prompt prefix, letting
+        # prefix-caching LLM backends skip re-prefilling the resume tokens
         prompt = f"""
-Please tailor the following resume to match the job description provided. 
+Please tailor the following resume to match the job description provided.
+
+**ORIGINAL RESUME:**
+{resume_text}
+
+**JOB DESCRIPTION:**
+{job_description}
 
 **INSTRUCTIONS:**
 1. Analyze the job description to identify key requirements, skills, and keywords
@@ -208,19 +219,29 @@ Please tailor the following resume to match the job description provided.
 8. Use a {tone} tone throughout
 9. Ensure ATS compatibility with clear section headers and bullet points{focus_instruction}
 
-**JOB DESCRIPTION:**
-{job_description}
-
-**ORIGINAL RESUME:**
-{resume_text}
-
 **OUTPUT FORMAT:**
 Provide the tailored resume in a clean, professional format with clear section headers. Use bullet points for experience items and ensure consistent formatting throughout.
 
 **TAILORED RESUME:**
 """
         return prompt
-    
+
+    def _prefix_cache_extra_body(self, resume_text: str) -> Optional[Dict]:
+        """
+        Build a stable per-resume cache marker for OpenAI-compatible backends
+        that support automatic prefix caching (e.g. vLLM). Groq has no such
+        parameter and OpenAI-compatible servers may reject unrecognized body
+        fields, so the marker is opt-in: set PREFIX_CACHE_ENABLED=1 only when
+        the client points at a server that uses it. Returns None (no extra
+        body) otherwise
+        """
+        if os.getenv('PREFIX_CACHE_ENABLED', '').lower() not in ('1', 'true', 'yes'):
+            return None
+        resume_prefix_hash = hashlib.blake2b(
+            resume_text.encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return {"prefix_cache_key": resume_prefix_hash}
+
     def generate_cover_letter(self, resume_text: str, job_description: str, 
                             company_name: str = "", position_title: str = "") -> Dict[str, str]:
         """
@@ -448,7 +469,8 @@ Format your response as JSON with these exact keys: overall_score, keyword_score
                     {"role": "user", "content": enhanced_prompt}
                 ],
                 max_tokens=4000,
-                temperature=0.3
+                temperature=0.3,
+                extra_body=self._prefix_cache_extra_body(resume_data.get('raw_text', ''))
             )
             
             tailored_resume = response.choices[0].message.content.strip()
@@ -507,30 +529,33 @@ Format your response as JSON with these exact keys: overall_score, keyword_score
         if focus_areas:
             focus_instruction = f"\nPay special attention to highlighting: {', '.join(focus_areas)}"
         
+        # Keep the (fixed) resume text ahead of the (variable) RAG context and
+        # job description so the prompt prefix stays stable across multiple
+        # JDs for the same session and prefix-caching backends can reuse it
         prompt = f"""
 Please tailor the following resume to match the job description using the provided contextual information.
 
+**ORIGINAL RESUME (Full Text):**
+{resume_data.get('raw_text', '')}
+
 **RAG ANALYSIS SUMMARY:**
 {context_summary}
 
 {context_section}
 
+**TARGET JOB DESCRIPTION:**
+{job_description}
+
 **INSTRUCTIONS:**
 1. Use the RAG-retrieved content above as the PRIMARY focus for tailoring
 2. Emphasize the most relevant experiences (highest similarity scores) prominently
-3. Incorporate job-specific keywords naturally throughout the content  
+3. Incorporate job-specific keywords naturally throughout the content
 4. Reorder sections to prioritize the most relevant content first
 5. Ensure the tailored resume highlights experiences that best match the job requirements
 6. Maintain professional formatting and readability
 7. Use quantifiable achievements where possible
 {focus_instruction}
 
-**TARGET JOB DESCRIPTION:**
-{job_description}
-
-**ORIGINAL RESUME (Full Text):**
-{resume_data.get('raw_text', '')}
-
 **TONE:** {tone}
 
 Please provide a complete, tailored resume that strategically emphasizes the most relevant content identified through RAG analysis:
@@ -5,7 +5,9 @@ Handles local processing and AI integration
 
 import os
 import json
+import functools
 import tempfile
+import concurrent.futures
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List, Any, Union
@@ -15,6 +17,51 @@ from backend.ai_tailor import AITailor
 from backend.resume_parser import ResumeParser
 from backend.job_parser import JobParser
 from backend.file_generator import FileGenerator
+from backend.session_store import create_session_store
+
+# How long a single render job may run before generate_files gives up
+RENDER_TIMEOUT_SECONDS = 30
+
+# Per-worker FileGenerator so render jobs don't have to pickle the parent
+# process's instance (it holds non-picklable ReportLab state)
+_worker_file_generator = None
+
+def _render_files(resume_text: str, formats: List[str], style: str) -> Dict[str, Any]:
+    """Run file generation inside a render-pool worker process"""
+    global _worker_file_generator
+    if _worker_file_generator is None:
+        _worker_file_generator = FileGenerator()
+    return _worker_file_generator.generate(
+        resume_text=resume_text,
+        formats=formats,
+        style=style
+    )
+
+def _session_endpoint(fn):
+    """
+    Decorator for session-bound endpoints: resolves the session once, returns
+    a normalized error dict when it is missing, persists the session after a
+    successful call, and converts exceptions into the standard error response.
+    Replaces the per-method guard + try/except boilerplate
+    """
+    @functools.wraps(fn)
+    def wrapper(self, session_id, *args, **kwargs):
+        session_data = self.store.get(session_id)
+        if session_data is None:
+            return {
+                'status': 'error',
+                'error': 'Session not found'
+            }
+        try:
+            result = fn(self, session_data, *args, **kwargs)
+            self.store.set(session_id, session_data)
+            return result
+        except Exception as e:
+            return {
+                'status': 'error',
+                'error': str(e)
+            }
+    return wrapper
 
 class HybridBackend:
     def __init__(self):
@@ -22,7 +69,15 @@ class HybridBackend:
         self.resume_parser = ResumeParser()
         self.job_parser = JobParser()
         self.file_generator = FileGenerator()
-        self.sessions = {}
+        # Session storage is pluggable (SESSION_BACKEND=redis|memory)
+        # so multi-worker deployments can share one copy of each session
+        self.store = create_session_store()
+        # Bounded pool for CPU-heavy PDF/DOCX rendering so file generation
+        # doesn't block the request thread (workers are spawned lazily on
+        # first submit, so worker processes never create pools of their own)
+        self._render_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        )
 
     def get_smart_resume(self):
         """Return instance for direct access"""
@@ -33,17 +88,18 @@ class HybridBackend:
         try:
             # Generate session ID
             session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
+
             # Parse resume
             parsed_data = self.resume_parser.parse(file)
-            
-            # Store session data
-            self.sessions[session_id] = {
-                'original_text': parsed_data['text'],
+
+            # Store session data. The resume text lives only in
+            # parsed_data['text'] - duplicating it per session bloats RAM for
+            # large multi-page PDFs once sessions accumulate
+            self.store.set(session_id, {
                 'parsed_data': parsed_data,
                 'file_type': parsed_data['file_type']
-            }
-            
+            })
+
             return {
                 'status': 'success',
                 'session_id': session_id,
@@ -51,7 +107,7 @@ class HybridBackend:
                 'file_type': parsed_data['file_type'],
                 'word_count': len(parsed_data['text'].split()),
                 'sections': parsed_data.get('sections', []),
-                'preview': parsed_data['text'][:500] + "..." if len(parsed_data['text']) > 500 else parsed_data['text']
+                'preview': f"{parsed_data['text'][:500]}..." if len(parsed_data['text']) > 500 else parsed_data['text']
             }
         except Exception as e:
             return {
@@ -73,180 +129,146 @@ class HybridBackend:
                 'error': str(e)
             }
 
-    def tailor_resume_standard(self, 
-                             session_id: str, 
-                             job_description: str, 
+    @_session_endpoint
+    def tailor_resume_standard(self,
+                             session_data: Dict[str, Any],
+                             job_description: str,
                              preferences: Optional[Dict] = None) -> Dict[str, Any]:
         """Standard resume tailoring"""
-        try:
-            if session_id not in self.sessions:
-                raise ValueError("Session not found")
-            
-            session_data = self.sessions[session_id]
-            original_text = session_data['original_text']
-            
-            # Tailor resume
-            result = self.ai_tailor.tailor_resume(
-                resume_text=original_text,
-                job_description=job_description,
-                preferences=preferences or {}
-            )
-            
-            # Store tailored version
-            self.sessions[session_id]['tailored_text'] = result['tailored_text']
-            
-            return {
-                'status': 'success',
-                'tailored_resume': result['tailored_text'],
-                'improvement_metrics': result.get('metrics', {})
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        original_text = session_data['parsed_data']['text']
+
+        # Tailor resume
+        result = self.ai_tailor.tailor_resume(
+            resume_text=original_text,
+            job_description=job_description,
+            preferences=preferences or {}
+        )
 
-    def tailor_resume_with_rag(self, 
-                              session_id: str, 
+        # Store tailored version
+        session_data['tailored_text'] = result['tailored_text']
+
+        return {
+            'status': 'success',
+            'tailored_resume': result['tailored_text'],
+            'improvement_metrics': result.get('metrics', {})
+        }
+
+    @_session_endpoint
+    def tailor_resume_with_rag(self,
+                              session_data: Dict[str, Any],
                               job_description: str,
                               tone: str = "professional",
                               focus_areas: Optional[List[str]] = None) -> Dict[str, Any]:
         """RAG-enhanced resume tailoring"""
-        try:
-            if session_id not in self.sessions:
-                raise ValueError("Session not found")
-            
-            session_data = self.sessions[session_id]
-            original_text = session_data['original_text']
-            
-            # Use RAG-enhanced tailoring
-            result = self.ai_tailor.tailor_resume_rag(
-                resume_text=original_text,
-                job_description=job_description,
-                tone=tone,
-                focus_areas=focus_areas or []
-            )
-            
-            # Store tailored version
-            self.sessions[session_id]['tailored_text'] = result['tailored_text']
-            
-            return {
-                'status': 'success',
-                'tailored_resume': result['tailored_text'],
-                'improvement_metrics': result.get('metrics', {}),
-                'rag_context_summary': result.get('context_summary', '')
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        original_text = session_data['parsed_data']['text']
+
+        # Use RAG-enhanced tailoring
+        result = self.ai_tailor.tailor_resume_rag(
+            resume_text=original_text,
+            job_description=job_description,
+            tone=tone,
+            focus_areas=focus_areas or []
+        )
+
+        # Store tailored version
+        session_data['tailored_text'] = result['tailored_text']
+
+        return {
+            'status': 'success',
+            'tailored_resume': result['tailored_text'],
+            'improvement_metrics': result.get('metrics', {}),
+            'rag_context_summary': result.get('context_summary', '')
+        }
 
-    def tailor_resume_with_agents(self, 
-                                 session_id: str, 
+    @_session_endpoint
+    def tailor_resume_with_agents(self,
+                                 session_data: Dict[str, Any],
                                  job_description: str) -> Dict[str, Any]:
         """Multi-agent resume tailoring"""
-        try:
-            if session_id not in self.sessions:
-                raise ValueError("Session not found")
-            
-            session_data = self.sessions[session_id]
-            original_text = session_data['original_text']
-            
-            # Use multi-agent system
-            result = self.ai_tailor.tailor_resume_agents(
-                resume_text=original_text,
-                job_description=job_description
-            )
-            
-            # Store tailored version
-            self.sessions[session_id]['tailored_text'] = result['tailored_text']
-            
-            return {
-                'status': 'success',
-                'tailored_resume': result['tailored_text'],
-                'improvement_metrics': result.get('metrics', {}),
-                'agents_used': result.get('agents_used', []),
-                'processing_messages': result.get('processing_messages', []),
-                'improvement_notes': result.get('improvement_notes', [])
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        original_text = session_data['parsed_data']['text']
 
-    def analyze_ats_score(self, 
-                         session_id: str, 
-                         job_description: str) -> Dict[str, Any]:
-        """Analyze ATS compatibility"""
-        try:
-            if session_id not in self.sessions:
-                raise ValueError("Session not found")
-            
-            session_data = self.sessions[session_id]
-            current_text = session_data.get('tailored_text', session_data['original_text'])
-            
-            # Analyze ATS compatibility
-            analysis = self.ai_tailor.analyze_ats(
-                resume_text=current_text,
-                job_description=job_description
-            )
-            
-            return {
-                'status': 'success',
-                **analysis
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        # Use multi-agent system
+        result = self.ai_tailor.tailor_resume_agents(
+            resume_text=original_text,
+            job_description=job_description
+        )
+
+        # Store tailored version
+        session_data['tailored_text'] = result['tailored_text']
 
-    def generate_files(self, 
-                      session_id: str, 
-                      file_format: str = "both", 
+        return {
+            'status': 'success',
+            'tailored_resume': result['tailored_text'],
+            'improvement_metrics': result.get('metrics', {}),
+            'agents_used': result.get('agents_used', []),
+            'processing_messages': result.get('processing_messages', []),
+            'improvement_notes': result.get('improvement_notes', [])
+        }
+
+    def get_current_text(self, session_id: str) -> Optional[str]:
+        """Current resume text for a session (tailored when present)"""
+        session_data = self.store.get(session_id)
+        if session_data is None:
+            return None
+        return session_data.get('tailored_text') or session_data['parsed_data']['text']
+
+    @_session_endpoint
+    def analyze_ats_score(self,
+                         session_data: Dict[str, Any],
+                         job_description: str,
+                         resume_text: str = None) -> Dict[str, Any]:
+        """Analyze ATS compatibility. Callers running concurrently with a
+        tailoring call pass an explicit resume_text snapshot so the score
+        isn't racing writes to the shared session dict"""
+        current_text = resume_text or session_data.get('tailored_text') or session_data['parsed_data']['text']
+
+        # Analyze ATS compatibility
+        analysis = self.ai_tailor.analyze_ats(
+            resume_text=current_text,
+            job_description=job_description
+        )
+
+        return {
+            'status': 'success',
+            **analysis
+        }
+
+    @_session_endpoint
+    def generate_files(self,
+                      session_data: Dict[str, Any],
+                      file_format: str = "both",
                       style: str = "modern") -> Dict[str, Any]:
         """Generate downloadable files"""
-        try:
-            if session_id not in self.sessions:
-                raise ValueError("Session not found")
-            
-            session_data = self.sessions[session_id]
-            current_text = session_data.get('tailored_text', session_data['original_text'])
-            
-            # Generate files
-            result = self.file_generator.generate(
-                resume_text=current_text,
-                formats=[file_format] if file_format != "both" else ["pdf", "docx"],
-                style=style
-            )
-            
-            # Store generated files
-            self.sessions[session_id]['generated_files'] = result['files']
-            
-            return {
-                'status': 'success',
-                'formats_generated': list(result['files'].keys())
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        current_text = session_data.get('tailored_text') or session_data['parsed_data']['text']
+        formats = [file_format] if file_format != "both" else ["pdf", "docx"]
 
-    def get_generated_file_bytes(self, 
-                               session_id: str, 
+        # Render in the worker pool so the request thread stays responsive
+        future = self._render_pool.submit(_render_files, current_text, formats, style)
+        result = future.result(timeout=RENDER_TIMEOUT_SECONDS)
+
+        # Store generated files
+        session_data['generated_files'] = result['files']
+
+        return {
+            'status': 'success',
+            'formats_generated': list(result['files'].keys())
+        }
+
+    def get_generated_file_bytes(self,
+                               session_id: str,
                                file_format: str) -> Optional[bytes]:
         """Get generated file content"""
+        # Returns raw bytes (or None) rather than a status dict, so it stays
+        # outside the _session_endpoint decorator
         try:
-            if session_id not in self.sessions:
+            session_data = self.store.get(session_id)
+            if session_data is None:
                 raise ValueError("Session not found")
-            
-            files = self.sessions[session_id].get('generated_files', {})
+
+            files = session_data.get('generated_files', {})
             if file_format not in files:
                 raise ValueError(f"No {file_format} file generated for this session")
-            
+
             return files[file_format]
         except Exception:
             return None
@@ -259,4 +281,4 @@ def get_smart_resume():
     global _instance
     if _instance is None:
         _instance = HybridBackend()
-    return _instance
\ No newline at end of file
+    return _instance
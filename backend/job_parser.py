@@ -6,6 +6,7 @@ Extracts keywords, skills, and requirements from job descriptions
 import re
 import logging
 from typing import Dict, List, Set
+import numpy as np
 from keybert import KeyBERT
 from collections import Counter
 
@@ -56,6 +57,21 @@ class JobParser:
                 'time management', 'project management', 'critical thinking', 'innovation'
             ]
             
+            # Precomputed ASCII byte patterns for the skill scan in
+            # _extract_skills: bytes.find is a faster C-level search than
+            # str.__contains__ and avoids re-lowercasing the text per skill.
+            # Each entry also carries the skill's trigram set so short JDs can
+            # skip skills whose trigrams don't appear at all (cheap set subset
+            # check before the substring scan); sub-3-char skills get an empty
+            # set and always fall through to the normal check
+            flat_tech_skills = [skill for skills in self.tech_skills.values() for skill in skills]
+            self._tech_skill_patterns = tuple(
+                self._make_skill_pattern(skill) for skill in flat_tech_skills
+            )
+            self._soft_skill_patterns = tuple(
+                self._make_skill_pattern(skill) for skill in self.soft_skills
+            )
+
             # Experience level indicators
             self.experience_levels = {
                 'entry': ['entry level', 'junior', '0-2 years', 'graduate', 'intern'],
@@ -67,6 +83,13 @@ class JobParser:
             logger.error(f"Error initializing JobParser: {str(e)}")
             self.kw_model = None
             self.nlp = None
+
+    @staticmethod
+    def _make_skill_pattern(skill: str):
+        """Build the (skill, byte pattern, trigram set) triple used by _extract_skills"""
+        lowered = skill.lower()
+        trigrams = frozenset(lowered[i:i + 3] for i in range(len(lowered) - 2))
+        return skill, lowered.encode('ascii', 'ignore'), trigrams
     
     def parse_job_description(self, job_text: str) -> Dict:
         """
@@ -150,7 +173,16 @@ class JobParser:
         # Remove common stop words
         stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an'}
         words = [word for word in text.split() if word not in stop_words and len(word) > 2]
-        
+
+        if len(words) > 5000:
+            # For huge JDs, O(N) counting plus O(N) top-k selection via
+            # argpartition beats sorting the full frequency distribution
+            uniq, counts = np.unique(np.array(words, dtype=object), return_counts=True)
+            k = min(20, len(uniq))
+            top = np.argpartition(counts, -k)[-k:]
+            order = top[np.argsort(-counts[top])]
+            return uniq[order].tolist()
+
         # Get most common words
         word_freq = Counter(words)
         return [word for word, count in word_freq.most_common(20)]
@@ -161,15 +193,28 @@ class JobParser:
         soft_skills = []
         
         try:
+            # Lowercase and encode exactly once, then scan with bytes.find
+            # instead of re-lowercasing the whole text for every skill
+            text_lower = text.lower()
+            text_bytes = text_lower.encode('ascii', 'ignore')
+
+            # Trigram prefilter: a skill can only match if all of its trigrams
+            # occur in the text, so most of the catalog is skipped on short JDs
+            # before the substring scan even runs
+            text_trigrams = set(text_lower[i:i + 3] for i in range(len(text_lower) - 2))
+
             # Extract technical skills
-            for category, skills in self.tech_skills.items():
-                for skill in skills:
-                    if skill.lower() in text.lower():
-                        technical_skills.append(skill)
-            
+            for skill, skill_bytes, trigrams in self._tech_skill_patterns:
+                if trigrams and not trigrams <= text_trigrams:
+                    continue
+                if skill_bytes in text_bytes:
+                    technical_skills.append(skill)
+
             # Extract soft skills
-            for skill in self.soft_skills:
-                if skill.lower() in text.lower():
+            for skill, skill_bytes, trigrams in self._soft_skill_patterns:
+                if trigrams and not trigrams <= text_trigrams:
+                    continue
+                if skill_bytes in text_bytes:
                     soft_skills.append(skill)
             
             # Remove duplicates while preserving order
@@ -265,22 +310,27 @@ class JobParser:
         """
         try:
             resume_lower = resume_text.lower()
-            
+
+            # Tokenize the resume once into a hash set so single-word terms
+            # are O(1) lookups instead of full substring scans per term;
+            # multi-word terms still fall back to a substring check
+            resume_tokens = set(re.findall(r'[a-z0-9+#.]+', resume_lower))
+
+            def term_present(term: str) -> bool:
+                term_lower = term.lower()
+                if ' ' in term_lower:
+                    return term_lower in resume_lower
+                return term_lower in resume_tokens or term_lower in resume_lower
+
             # Technical skills match
-            tech_skills_found = []
-            for skill in job_requirements.get('technical_skills', []):
-                if skill.lower() in resume_lower:
-                    tech_skills_found.append(skill)
-            
-            tech_match_score = len(tech_skills_found) / max(len(job_requirements.get('technical_skills', [])), 1) * 100
-            
+            tech_skills = job_requirements.get('technical_skills', [])
+            tech_skills_found = [skill for skill in tech_skills if term_present(skill)]
+            tech_match_score = len(tech_skills_found) / max(len(tech_skills), 1) * 100
+
             # Keyword match
-            keywords_found = []
-            for keyword in job_requirements.get('keywords', []):
-                if keyword.lower() in resume_lower:
-                    keywords_found.append(keyword)
-            
-            keyword_match_score = len(keywords_found) / max(len(job_requirements.get('keywords', [])), 1) * 100
+            keywords = job_requirements.get('keywords', [])
+            keywords_found = [keyword for keyword in keywords if term_present(keyword)]
+            keyword_match_score = len(keywords_found) / max(len(keywords), 1) * 100
             
             # Overall match score (weighted average)
             overall_score = (tech_match_score * 0.6 + keyword_match_score * 0.4)
@@ -4,8 +4,11 @@ This removes the multi-agent endpoint to isolate the issue
 """
 
 import os
+import shutil
+import tempfile
 import logging
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -46,8 +49,16 @@ except Exception as e:
     logger.warning(f"❌ Resume parser failed: {e}")
     resume_parser = None
 
-# Global session storage
-session_data = {}
+# Global session storage. A TTLCache caps memory on a long-running API:
+# sessions are evicted after an hour (or once 1024 are live) instead of
+# accumulating forever in a plain dict
+try:
+    from cachetools import TTLCache
+    session_data = TTLCache(maxsize=1024, ttl=3600)
+    logger.info("✅ Session storage using TTLCache (maxsize=1024, ttl=3600)")
+except Exception as e:
+    logger.warning(f"❌ cachetools unavailable, falling back to dict: {e}")
+    session_data = {}
 
 @app.get("/")
 async def root():
@@ -83,17 +94,27 @@ async def upload_resume(file: UploadFile = File(...)):
                 detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
             )
         
-        # Save uploaded file
-        file_content = await file.read()
-        
         if not resume_parser:
             raise HTTPException(status_code=503, detail="Resume parser not available")
-        
-        # Parse resume
-        result = resume_parser.extract_text(
-            file_content=file_content,
-            filename=file.filename
-        )
+
+        # Copy the spooled upload to a temp file and parse it off the event
+        # loop: both the copy and the parse are blocking I/O, so they run on
+        # the threadpool instead of stalling every concurrent request
+        def _save_and_parse():
+            tmp_path = None
+            try:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp:
+                    shutil.copyfileobj(file.file, tmp, 1 << 16)
+                    tmp_path = tmp.name
+                return resume_parser.extract_text(file_path=tmp_path)
+            finally:
+                if tmp_path:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+
+        result = await run_in_threadpool(_save_and_parse)
         
         if result['status'] == 'error':
             raise HTTPException(status_code=400, detail=result.get('error', 'Failed to parse resume'))
@@ -4,22 +4,77 @@ Extracts text content from various file formats (PDF, DOCX, TXT)
 Uses pdfplumber for enhanced PDF text extraction
 """
 
+import concurrent.futures
 import io
 import os
 import re
 from typing import Dict, Optional
 import fitz  # PyMuPDF
-import pdfplumber
-from docx import Document
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging configuration is owned by the app entrypoint; this module only
+# acquires its logger
 logger = logging.getLogger(__name__)
 
+# Page count above which PDF text extraction is sharded across a process
+# pool; below it the ~50ms pool startup outweighs any win
+_PARALLEL_PAGE_THRESHOLD = 8
+
+def _extract_page_range(args) -> str:
+    """Extract text for one shard of pages (runs in a pool worker)"""
+    content, lo, hi = args
+    doc = fitz.open(stream=content, filetype="pdf")
+    try:
+        return "\n".join(doc[i].get_text("text") for i in range(lo, hi))
+    finally:
+        doc.close()
+
 class ResumeParser:
     """Class to parse resumes from different file formats"""
-    
+
+    # Compiled once at class creation - bound-method calls on precompiled
+    # patterns skip the re-cache lookup and argument parsing every
+    # _clean_text/_extract_contact_info call would otherwise pay
+    _WS_RE = re.compile(r'\s+')
+    _SPECIAL_RE = re.compile(r'[^\w\s\.\,\-\(\)\@\+\#]')
+    _MULTISPACE_RE = re.compile(r' +')
+    # Translate table dropping every disallowed latin-1 character in one
+    # C-level pass (filter/map instead of a comprehension, which could not
+    # see class-scope names)
+    _DROP_TBL = str.maketrans(
+        '', '', ''.join(filter(_SPECIAL_RE.match, map(chr, range(256))))
+    )
+    _EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    _PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+    _PHONE_PAREN_RE = re.compile(r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b')
+
+    # One alternation matching any section header line; a single C-level
+    # scan of the text replaces five per-line Python keyword loops. Like
+    # the per-line checks it replaced, a header is any short (<50 char)
+    # line containing a keyword, so variants such as "CAREER SUMMARY" or
+    # "SKILLS & ABILITIES" still open their section
+    _SECTION_RE = re.compile(
+        r'(?im)^(?=[^\n]{1,49}$)[^\n]*?\b('
+        r'professional experience|work experience|technical skills'
+        r'|core competencies|academic background|summary|objective|profile'
+        r'|skills|experience|employment|education|qualifications'
+        r'|projects|certifications'
+        r')\b[^\n]*$'
+    )
+
+
+    # Maps a matched header token (lowercased) to its canonical section key
+    _SECTION_KEY_MAP = {
+        'summary': 'summary', 'objective': 'summary', 'profile': 'summary',
+        'skills': 'skills', 'technical skills': 'skills',
+        'core competencies': 'skills',
+        'experience': 'experience', 'work experience': 'experience',
+        'employment': 'experience', 'professional experience': 'experience',
+        'education': 'education', 'academic background': 'education',
+        'qualifications': 'education',
+        'projects': 'other', 'certifications': 'other',
+    }
+
     def __init__(self):
         self.supported_formats = ['.pdf', '.docx', '.txt']
     
@@ -86,41 +141,84 @@ class ResumeParser:
             }
     
     def _extract_from_pdf(self, content: bytes) -> str:
-        """Extract text from PDF content using pdfplumber for better accuracy"""
+        """Extract text from PDF content using PyMuPDF, with pdfplumber fallback"""
         try:
-            # First try with pdfplumber for better text extraction
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                
-                if text.strip():
-                    logger.info("✅ Successfully extracted text using pdfplumber")
-                    return text
-            
-            # Fallback to PyMuPDF if pdfplumber fails
-            logger.info("🔄 Falling back to PyMuPDF extraction")
+            # PyMuPDF first: for plain text extraction it is 5-30x faster
+            # than the pdfminer-based parsers, and this module never needs
+            # tables or layout
             doc = fitz.open(stream=content, filetype="pdf")
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text
-            
+            try:
+                page_count = doc.page_count
+                if page_count > _PARALLEL_PAGE_THRESHOLD:
+                    # Page extraction is embarrassingly parallel: shard the
+                    # page range across worker processes, each opening its
+                    # own document on the same bytes, and reassemble in order
+                    workers = min(os.cpu_count() or 1, page_count)
+                    step = -(-page_count // workers)  # ceil division
+                    shards = [
+                        (content, lo, min(lo + step, page_count))
+                        for lo in range(0, page_count, step)
+                    ]
+                    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                        text = "\n".join(pool.map(_extract_page_range, shards))
+                else:
+                    text = "\n".join(page.get_text("text") for page in doc)
+            finally:
+                doc.close()
+
+            if text.strip():
+                logger.info("✅ Successfully extracted text using PyMuPDF")
+                return text
+
+            # Fallback to pdfplumber only when PyMuPDF finds no text.
+            # Imported lazily so the fast path never pays the pdfminer
+            # import cost
+            logger.info("🔄 Falling back to pdfplumber extraction")
+            import pdfplumber
+            with pdfplumber.open(io.BytesIO(content)) as pdf:
+                # Collect pages and join once - repeated += on a growing
+                # string is quadratic in CPython
+                parts = [
+                    page_text for page_text in
+                    (page.extract_text() for page in pdf.pages)
+                    if page_text
+                ]
+            return "\n".join(parts) + ("\n" if parts else "")
+
         except Exception as e:
             logger.error(f"Error extracting from PDF: {str(e)}")
             raise
     
     def _extract_from_docx(self, content: bytes) -> str:
         """Extract text from DOCX content"""
+        # Fast path: read word/document.xml straight out of the zip and walk
+        # the <w:p>/<w:t> nodes with ElementTree. One XML pass, no Paragraph
+        # wrapper object per paragraph as with python-docx
+        try:
+            import zipfile
+            import xml.etree.ElementTree as ET
+
+            with zipfile.ZipFile(io.BytesIO(content)) as z:
+                document_xml = z.read('word/document.xml')
+
+            w_ns = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+            root = ET.fromstring(document_xml)
+            paragraphs = [
+                ''.join(t.text for t in para.iter(f'{w_ns}t') if t.text)
+                for para in root.iter(f'{w_ns}p')
+            ]
+            return "\n".join(paragraphs)
+        except Exception as e:
+            logger.warning(f"⚠️ Direct DOCX XML extraction failed: {e}, using python-docx")
+
         try:
+            # Imported lazily - PDF-only workloads never pay the python-docx
+            # import cost
+            from docx import Document
+
             doc = Document(io.BytesIO(content))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            # One join instead of a += per paragraph (quadratic on big files)
+            return "\n".join(paragraph.text for paragraph in doc.paragraphs)
         except Exception as e:
             logger.error(f"Error extracting from DOCX: {str(e)}")
             raise
@@ -138,13 +236,14 @@ class ResumeParser:
     
     def _clean_text(self, text: str) -> str:
         """Clean and format extracted text"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\,\-\(\)\@\+\#]', '', text)
-        # Remove multiple spaces
-        text = re.sub(r' +', ' ', text)
-        return text.strip()
+        # Drop disallowed characters with one str.translate pass (C-level,
+        # single allocation) instead of a regex scan, then collapse all
+        # whitespace in a single sub. Characters above latin-1 still need
+        # the regex, but only non-ASCII text pays for it
+        text = text.translate(self._DROP_TBL)
+        if not text.isascii():
+            text = self._SPECIAL_RE.sub('', text)
+        return self._WS_RE.sub(' ', text).strip()
     
     def _parse_sections(self, text: str) -> Dict[str, str]:
         """
@@ -161,21 +260,21 @@ class ResumeParser:
         }
         
         try:
-            # Convert to lowercase for pattern matching
-            text_lower = text.lower()
-            
-            # Define section patterns
-            patterns = {
-                'contact_info': self._extract_contact_info(text),
-                'summary': self._extract_section(text, ['summary', 'objective', 'profile']),
-                'skills': self._extract_section(text, ['skills', 'technical skills', 'core competencies']),
-                'experience': self._extract_section(text, ['experience', 'work experience', 'employment', 'professional experience']),
-                'education': self._extract_section(text, ['education', 'academic background', 'qualifications'])
-            }
-            
-            for section, content in patterns.items():
-                sections[section] = content
-                
+            sections['contact_info'] = self._extract_contact_info(text)
+
+            # One finditer pass locates every section header; each section's
+            # body is the slice up to the next header's start
+            matches = list(self._SECTION_RE.finditer(text))
+            for i, match in enumerate(matches):
+                key = self._SECTION_KEY_MAP.get(match.group(1).lower())
+                if not key or sections[key]:
+                    continue
+                end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+                content = text[match.end():end].strip()
+                if content:
+                    # Limit to first 20 lines to avoid too much content
+                    sections[key] = '\n'.join(content.split('\n')[:20])
+
         except Exception as e:
             logger.error(f"Error parsing sections: {str(e)}")
         
@@ -183,44 +282,11 @@ class ResumeParser:
     
     def _extract_contact_info(self, text: str) -> str:
         """Extract contact information (email, phone, etc.)"""
-        contact_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # Phone
-            r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b'  # Phone with area code
-        ]
-        
         contact_info = []
-        for pattern in contact_patterns:
-            matches = re.findall(pattern, text)
-            contact_info.extend(matches)
-        
+        for pattern in (self._EMAIL_RE, self._PHONE_RE, self._PHONE_PAREN_RE):
+            contact_info.extend(pattern.findall(text))
+
         return ' | '.join(contact_info)
-    
-    def _extract_section(self, text: str, keywords: list) -> str:
-        """Extract content for a specific section based on keywords"""
-        text_lines = text.split('\n')
-        section_content = []
-        capturing = False
-        
-        for i, line in enumerate(text_lines):
-            line_lower = line.lower().strip()
-            
-            # Check if this line starts a section we're looking for
-            for keyword in keywords:
-                if keyword.lower() in line_lower and len(line_lower) < 50:  # Section headers are usually short
-                    capturing = True
-                    break
-            
-            # Stop capturing if we hit another section header
-            if capturing and i > 0:
-                next_section_keywords = ['summary', 'objective', 'skills', 'experience', 'education', 'projects', 'certifications']
-                if any(kw in line_lower for kw in next_section_keywords) and len(line_lower) < 50 and not any(kw in keywords for kw in next_section_keywords if kw in line_lower):
-                    break
-            
-            if capturing and line.strip():
-                section_content.append(line.strip())
-        
-        return '\n'.join(section_content[:20])  # Limit to first 20 lines to avoid too much content
 
 def test_parser():
     """Test function for the resume parser"""
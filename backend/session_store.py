@@ -0,0 +1,151 @@
+"""
+Session Store Module for ZubeResume AI
+Pluggable session storage so session data can be shared across worker processes
+instead of living in each worker's heap
+"""
+
+import os
+import json
+import logging
+from typing import Optional, Dict, Any
+
+# Optional Redis support - only needed when SESSION_BACKEND=redis
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Default session lifetime (seconds) for stores that support expiry
+DEFAULT_SESSION_TTL = 3600
+
+
+class SessionStore:
+    """Protocol-style base class for session storage backends"""
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the session dict for session_id, or None if not found"""
+        raise NotImplementedError
+
+    def set(self, session_id: str, data: Dict[str, Any]) -> None:
+        """Store (or replace) the session dict for session_id"""
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session if it exists"""
+        raise NotImplementedError
+
+    def exists(self, session_id: str) -> bool:
+        """Check whether a session exists"""
+        raise NotImplementedError
+
+
+class InMemorySessionStore(SessionStore):
+    """Simple per-process dict store (original behavior, single-worker deployments)"""
+
+    def __init__(self):
+        self._sessions = {}
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self._sessions.get(session_id)
+
+    def set(self, session_id: str, data: Dict[str, Any]) -> None:
+        self._sessions[session_id] = data
+
+    def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def exists(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis-backed store so multiple workers (or hosts) share one copy of each
+    session. Text fields are JSON-encoded; generated file bytes are stored raw
+    under separate keys to avoid JSON overhead on large buffers
+    """
+
+    def __init__(self, url: str = None, ttl: int = DEFAULT_SESSION_TTL):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package not installed")
+        self.ttl = ttl
+        self.client = redis.Redis.from_url(
+            url or os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            decode_responses=False
+        )
+        # Fail fast if the server is unreachable
+        self.client.ping()
+
+    def _key(self, session_id: str) -> str:
+        return f"zuberesume:session:{session_id}"
+
+    def _file_key(self, session_id: str, file_format: str) -> str:
+        return f"zuberesume:session:{session_id}:{file_format}"
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self._key(session_id))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        file_formats = data.pop('_file_formats', [])
+        if file_formats:
+            generated_files = {}
+            for file_format in file_formats:
+                file_bytes = self.client.get(self._file_key(session_id, file_format))
+                if file_bytes is not None:
+                    generated_files[file_format] = file_bytes
+            data['generated_files'] = generated_files
+        return data
+
+    def set(self, session_id: str, data: Dict[str, Any]) -> None:
+        data = dict(data)
+        generated_files = data.pop('generated_files', None)
+        if generated_files:
+            data['_file_formats'] = list(generated_files.keys())
+            for file_format, file_bytes in generated_files.items():
+                self.client.setex(
+                    self._file_key(session_id, file_format), self.ttl, file_bytes
+                )
+        self.client.setex(self._key(session_id), self.ttl, json.dumps(data))
+
+    def delete(self, session_id: str) -> None:
+        raw = self.client.get(self._key(session_id))
+        if raw is not None:
+            data = json.loads(raw)
+            for file_format in data.get('_file_formats', []):
+                self.client.delete(self._file_key(session_id, file_format))
+        self.client.delete(self._key(session_id))
+
+    def exists(self, session_id: str) -> bool:
+        return bool(self.client.exists(self._key(session_id)))
+
+
+def create_session_store() -> SessionStore:
+    """
+    Create the session store selected by the SESSION_BACKEND environment
+    variable (redis | memory). Redis is the only backend that actually
+    shares sessions across worker processes; in-memory is per-worker and
+    suits single-worker deployments. Falls back to in-memory on any
+    initialization failure so the app keeps working
+    """
+    backend = os.getenv('SESSION_BACKEND', 'memory').lower()
+
+    if backend == 'redis':
+        try:
+            store = RedisSessionStore()
+            logger.info("✅ Using Redis session store")
+            return store
+        except Exception as e:
+            logger.warning(f"⚠️ Redis session store unavailable ({e}), using in-memory store")
+    elif backend == 'shared_memory':
+        # Removed: the shared-memory store was still per-process (the
+        # session dict and shm handles lived in each worker), so it never
+        # actually shared anything. Use redis for multi-worker setups
+        logger.warning("⚠️ shared_memory backend removed; use SESSION_BACKEND=redis for multi-worker deployments")
+
+    return InMemorySessionStore()
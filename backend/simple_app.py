@@ -7,21 +7,41 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 import os
 
+# orjson serializes responses 2-5x faster than the stdlib json encoder;
+# fall back to the default response class when it isn't installed.
+# ORJSONResponse itself always imports (it only asserts orjson at render
+# time), so probe for the orjson package before choosing it
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _ResponseClass
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# In production, skip mounting the docs/openapi endpoints (first hit on
+# /docs otherwise builds the whole schema, ~100ms)
+_PROD = os.getenv("ENVIRONMENT", "").lower() == "production"
+
 # Create FastAPI app
 app = FastAPI(
     title="SmartResume AI API - Simplified",
     description="Simplified version for troubleshooting",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_ResponseClass,
+    docs_url=None if _PROD else "/docs",
+    redoc_url=None if _PROD else "/redoc",
+    openapi_url=None if _PROD else "/openapi.json"
 )
 
-# Add CORS middleware
+# Add CORS middleware. Specific origins (comma-separated ALLOWED_ORIGINS)
+# keep preflight responses cacheable; the wildcard remains the default
+_origins = [o for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -1,7 +1,7 @@
 """
-Advanced Text Processing Module using Hugging Face Tokenizers
-Uses Hugging Face's pre-trained tokenizers that work offline and are highly reliable
-No network dependencies after initial download!
+Advanced Text Processing Module
+Fast regex-based cleaning and structuring of resume text
+No network dependencies!
 """
 
 import re
@@ -9,74 +9,123 @@ import logging
 from typing import List, Dict, Tuple
 from collections import Counter
 
-# Import Hugging Face tokenizers - work offline and are very reliable
-try:
-    from tokenizers import Tokenizer
-    from transformers import AutoTokenizer, GPT2TokenizerFast
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
-    print("Hugging Face tokenizers not available, using pure regex fallback")
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging configuration is owned by the app entrypoint
 logger = logging.getLogger(__name__)
 
+# Common stop words for keyword extraction, shared by every instance
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'or', 'but', 'this', 'these', 'they',
+    'them', 'their', 'we', 'you', 'your', 'our', 'my', 'me', 'i'
+})
+
+# Section header keywords as a frozenset: membership is one O(1) hash
+# lookup in C instead of 14+ Python-level equality comparisons per line
+_SECTION_KEYWORDS = frozenset({
+    'SUMMARY', 'PROFESSIONAL SUMMARY', 'OBJECTIVE', 'PROFILE',
+    'SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'TECHNOLOGIES',
+    'EXPERIENCE', 'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE',
+    'EDUCATION', 'ACADEMIC BACKGROUND', 'QUALIFICATIONS',
+    'PROJECTS', 'KEY PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS'
+})
+
 class TextProcessor:
-    """Advanced text processor using Hugging Face tokenizers and smart regex patterns"""
+    """Advanced text processor using smart regex patterns"""
     
-    def __init__(self):
-        """Initialize the text processor with Hugging Face tokenizers"""
-        
-        # Initialize Hugging Face tokenizer (temporarily disabled for faster startup)
-        if False and HF_AVAILABLE:  # Temporarily disabled
-            try:
-                # Try to use cached tokenizer first, then download if needed
-                logger.info("Initializing Hugging Face tokenizer (may download on first use)...")
-                self.tokenizer = GPT2TokenizerFast.from_pretrained('gpt2', local_files_only=False)
-                self.tokenizer.pad_token = self.tokenizer.eos_token
-                logger.info("✅ Hugging Face GPT-2 tokenizer initialized successfully")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not initialize HF tokenizer: {e}, using regex fallback")
-                self.tokenizer = None
-        else:
-            logger.info("⚡ Using fast regex-based text processing (HF tokenizer disabled for speed)")
-            self.tokenizer = None
-        
-        # Common stop words (predefined list - no download needed)
-        self.stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'or', 'but', 'this', 'these', 'they',
-            'them', 'their', 'we', 'you', 'your', 'our', 'my', 'me', 'i'
-        }
-        
-        # Enhanced patterns for better text structure detection
-        self.sentence_endings = re.compile(r'[.!?]+\s+')
-        self.bullet_patterns = re.compile(r'^[\s]*[•\-\*●]\s+')
-        self.section_headers = re.compile(r'^[A-Z\s]+:?\s*$')
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?[\(\s]?\d{3}[\)\s-]?\d{3}[-.\s]?\d{4}')
-        self.url_pattern = re.compile(r'https?://[^\s]+|www\.[^\s]+|linkedin\.com/[^\s]+')
-        
-        # Smart spacing patterns - these fix the jamming issues
-        self.comma_fix = re.compile(r'([a-zA-Z]),([a-zA-Z])')  # Fix: word,word → word, word
-        self.period_fix = re.compile(r'([a-z])\.([A-Z])')  # Fix: word.Word → word. Word
-        self.pipe_fix = re.compile(r'([a-zA-Z])\|([a-zA-Z])')  # Fix: word|word → word | word
-        self.colon_fix = re.compile(r'([a-zA-Z]):([a-zA-Z])')  # Fix: word:word → word: word
-        self.dash_fix = re.compile(r'([a-zA-Z])-([a-zA-Z])')  # Fix compound words carefully
-        self.number_fix = re.compile(r'(\d)([A-Za-z])')  # Fix: 5years → 5 years
-        self.percent_fix = re.compile(r'(\d)%([A-Za-z])')  # Fix: 40%improvement → 40% improvement
-        
-        # Patterns for resume-specific content
-        self.achievement_starters = re.compile(r'^(developed|implemented|led|managed|created|built|designed|improved|increased|reduced|collaborated|achieved|delivered|optimized|streamlined|executed)', re.IGNORECASE)
-        self.role_patterns = re.compile(r'(engineer|developer|analyst|manager|lead|specialist|director|coordinator)', re.IGNORECASE)
-        
+    # Every pattern below is compiled once when the class is created, so
+    # short-lived TextProcessor() instances (one per request in the API
+    # flow) no longer pay the compilation cost. self.xxx references keep
+    # working via class-attribute lookup
+
+    # Common stop words (predefined list - no download needed)
+    stop_words = _STOP_WORDS
+
+    # Enhanced patterns for better text structure detection
+    sentence_endings = re.compile(r'[.!?]+\s+')
+    bullet_patterns = re.compile(r'^[\s]*[•\-\*●]\s+')
+    section_headers = re.compile(r'^[A-Z\s]+:?\s*$')
+    email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?[\(\s]?\d{3}[\)\s-]?\d{3}[-.\s]?\d{4}')
+    url_pattern = re.compile(r'https?://[^\s]+|www\.[^\s]+|linkedin\.com/[^\s]+')
+
+    # Smart spacing patterns - these fix the jamming issues. Fused into
+    # one alternation so a single scan handles every jam kind instead of
+    # six sequential whole-string re.sub passes
+    # The trailing letter is a lookahead rather than consumed, so chained
+    # jams like "a,b.C" are all caught in the same scan
+    jam_fix = re.compile(
+        r'(?P<comma>[a-zA-Z],(?=[a-zA-Z]))'      # word,word → word, word
+        r'|(?P<period>[a-z]\.(?=[A-Z]))'         # word.Word → word. Word
+        r'|(?P<pipe>[a-zA-Z]\|(?=[a-zA-Z]))'     # word|word → word | word
+        r'|(?P<colon>[a-zA-Z]:(?=[a-zA-Z]))'     # word:word → word: word
+        r'|(?P<percent>\d%(?=[A-Za-z]))'         # 40%improvement → 40% improvement
+        r'|(?P<number>\d(?=[A-Za-z]))'           # 5years → 5 years
+    )
+    dash_fix = re.compile(r'([a-zA-Z])-([a-zA-Z])')  # Fix compound words carefully
+    multispace_fix = re.compile(r'  +')  # Multiple spaces → single space
+
+    # Final-cleanup passes run on the whole string ([ \t] rather than \s
+    # so they never merge across newlines)
+    pipe_norm = re.compile(r'[ \t]*\|[ \t]*')       # Normalize pipes
+    line_edge = re.compile(r'^[ \t]+|[ \t]+$', re.MULTILINE)
+    blank_collapse = re.compile(r'\n{3,}')          # Max 1 blank line
+
+    # camelCase splitter that leaves known compound identifiers alone.
+    # The whitelist alternative matches first (leftmost), so the
+    # lowercase-uppercase split inside e.g. "JavaScript" never fires
+    camel_split = re.compile(
+        r'\b(?:JavaScript|TypeScript|CoffeeScript|MongoDB|GitHub|GitLab'
+        r'|BitBucket|PostgreSQL|MySQL|SQLite|DevOps|DevSecOps|iOS|macOS'
+        r'|iPhone|iPad|LinkedIn|PowerPoint|SharePoint|YouTube|LaTeX'
+        r'|OpenCV|OpenGL|PyTorch|TensorFlow|FastAPI|NumPy|SciPy'
+        r'|JavaServer|WordPress|InDesign)\b'
+        r'|([a-z])([A-Z])'
+    )
+
+    # Smart quote / dash fixups as a single translate table - one C-level
+    # pass instead of a chain of .replace() calls that each reallocate and
+    # rescan the string
+    _ENC_TBL = str.maketrans({
+        '‘': "'", '’': "'",   # smart single quotes
+        '“': '"', '”': '"',   # smart double quotes
+        '–': '-',                  # en dash
+        '—': ' - ',                # em dash
+    })
+
+    # Previously inline re.sub/re.match/re.findall string patterns
+    _TABS_RE = re.compile(r'[ \t]+')
+    _SENT_CAP_RE = re.compile(r'([.!?])\s*([A-Z])')
+    _BULLET_RE = re.compile(r'^[\s]*[•\-\*●]\s*')
+    _WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+    # Lines that should never become bullets (section headers, contact
+    # details, URLs) folded into one alternation so classification is a
+    # single regex call per line instead of four
+    _NON_BULLET_RE = re.compile(
+        r'^[A-Z\s]+:?\s*$'
+        r'|\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        r'|(\+?\d{1,3}[-.\s]?)?[\(\s]?\d{3}[\)\s-]?\d{3}[-.\s]?\d{4}'
+        r'|https?://[^\s]+|www\.[^\s]+|linkedin\.com/[^\s]+'
+    )
+
+    # Achievement indicators as one case-insensitive alternation: a single
+    # C scan replaces a per-line .lower() allocation plus ten Python
+    # substring checks
+    _ACHIEVEMENT_INDICATORS_RE = re.compile(
+        r'(?i)achieving|resulting|%|users|\$|million'
+        r'|increased|decreased|improved|reduced|enhanced'
+    )
+
+    # Patterns for resume-specific content
+    achievement_starters = re.compile(r'^(developed|implemented|led|managed|created|built|designed|improved|increased|reduced|collaborated|achieved|delivered|optimized|streamlined|executed)', re.IGNORECASE)
+    role_patterns = re.compile(r'(engineer|developer|analyst|manager|lead|specialist|director|coordinator)', re.IGNORECASE)
+
+
     def clean_and_structure_text(self, text: str) -> str:
         """
         Clean and structure resume text with proper spacing and formatting
-        Uses Hugging Face tokenizers for superior text processing
-        
+
         Args:
             text (str): Raw resume text from AI
             
@@ -85,8 +134,16 @@ class TextProcessor:
         """
         if not text:
             return ""
-        
-        logger.info("Starting advanced text processing with Hugging Face tokenizers...")
+
+        # Fast path: if the head of the document shows no jamming markers
+        # (well-structured extractor output usually doesn't), skip the heavy
+        # normalization passes and only run the final cleanup. Probing just
+        # the first 4KB keeps the check O(1) for large documents
+        if not self.jam_fix.search(text[:4096]):
+            logger.info("⚡ No jamming detected, skipping heavy text normalization")
+            return self._final_cleanup(text)
+
+        logger.info("Starting advanced text processing...")
         
         # Step 1: Fix obvious spacing issues first (most important for jamming)
         text = self._fix_jamming_issues(text)
@@ -94,52 +151,54 @@ class TextProcessor:
         # Step 2: Basic text cleaning
         text = self._basic_text_cleaning(text)
         
-        # Step 3: Advanced sentence processing with HF tokenizers
-        text = self._process_with_hf_tokenizer(text)
-        
-        # Step 4: Structure sections properly
-        text = self._structure_sections(text)
-        
-        # Step 5: Format bullet points and lists
-        text = self._format_bullet_points_enhanced(text)
-        
-        # Step 6: Fix paragraph spacing
-        text = self._fix_paragraph_spacing_enhanced(text)
-        
-        # Step 7: Final cleanup
-        text = self._final_cleanup(text)
+        # Steps 3-6 are line-oriented: split once and thread the line list
+        # through the list-based internals instead of each stage paying its
+        # own split/join round-trip on the whole string
+        lines = text.split('\n')
+
+        # Step 3: Structure sections properly
+        lines = self._structure_sections_lines(lines)
+
+        # Step 4: Format bullet points and lists
+        lines = self._format_bullet_points_lines(lines)
+
+        # Step 5: Fix paragraph spacing
+        lines = self._fix_paragraph_spacing_lines(lines)
+
+        # Step 6: Final cleanup (single join back to a string)
+        text = self._final_cleanup('\n'.join(lines))
         
         logger.info("Advanced text processing completed successfully")
         return text
     
+    @staticmethod
+    def _jam_sub(match) -> str:
+        """Insert the right spacing for whichever jam pattern fired"""
+        s = match.group()
+        if match.lastgroup == 'pipe':
+            return f"{s[0]} | "
+        # All other kinds keep what matched and add a trailing space
+        return f"{s} "
+
+    @staticmethod
+    def _camel_sub(match) -> str:
+        """Split a camelCase boundary; whitelisted compounds pass through"""
+        if match.group(1) is None:
+            return match.group()
+        return f"{match.group(1)} {match.group(2)}"
+
     def _fix_jamming_issues(self, text: str) -> str:
         """Fix the main jamming text issues immediately"""
-        # These are the most common jamming patterns - fix them first!
-        
-        # Fix comma spacing (Python,JavaScript → Python, JavaScript)
-        text = self.comma_fix.sub(r'\1, \2', text)
-        
-        # Fix period spacing (development.Specializes → development. Specializes)
-        text = self.period_fix.sub(r'\1. \2', text)
-        
-        # Fix pipe spacing (Engineer|555 → Engineer | 555)
-        text = self.pipe_fix.sub(r'\1 | \2', text)
-        
-        # Fix colon spacing (Languages:Python → Languages: Python)
-        text = self.colon_fix.sub(r'\1: \2', text)
-        
-        # Fix number-letter jamming (5years → 5 years)
-        text = self.number_fix.sub(r'\1 \2', text)
-        
-        # Fix percentage jamming (40%improvement → 40% improvement)
-        text = self.percent_fix.sub(r'\1% \2', text)
-        
-        # Fix common tech stack jamming
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # camelCase → camel Case
-        
+        # One fused scan fixes all the common jamming patterns at once
+        text = self.jam_fix.sub(self._jam_sub, text)
+
+        # Fix common tech stack jamming (camelCase → camel Case) without
+        # mangling correctly-cased identifiers like JavaScript or MongoDB
+        text = self.camel_split.sub(self._camel_sub, text)
+
         # Fix multiple spaces
-        text = re.sub(r'  +', ' ', text)  # Multiple spaces → single space
-        
+        text = self.multispace_fix.sub(' ', text)
+
         return text
     
     def _basic_text_cleaning(self, text: str) -> str:
@@ -154,85 +213,34 @@ class TextProcessor:
         for line in lines:
             if line.strip():
                 # Clean excessive spaces but preserve indentation
-                cleaned_line = re.sub(r'[ \t]+', ' ', line.strip())
+                cleaned_line = self._TABS_RE.sub(' ', line.strip())
                 cleaned_lines.append(cleaned_line)
             else:
                 cleaned_lines.append('')
         
         text = '\n'.join(cleaned_lines)
         
-        # Fix common encoding issues
-        text = text.replace("'", "'").replace(""", '"').replace(""", '"')
-        text = text.replace('–', '-').replace('—', ' - ')
+        # Fix common encoding issues (smart quotes and dashes) in one pass
+        text = text.translate(self._ENC_TBL)
         
         # Fix sentence spacing
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+        text = self._SENT_CAP_RE.sub(r'\1 \2', text)
         
         return text.strip()
     
-    def _process_with_hf_tokenizer(self, text: str) -> str:
-        """Use Hugging Face tokenizer for intelligent text processing"""
-        if not self.tokenizer:
-            return text
-        
-        lines = text.split('\n')
-        processed_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                processed_lines.append('')
-                continue
-            
-            # Skip section headers and special content
-            if (self.section_headers.match(line) or 
-                self.email_pattern.search(line) or 
-                self.phone_pattern.search(line) or
-                self.url_pattern.search(line)):
-                processed_lines.append(line)
-                continue
-            
-            # For substantial content, use HF tokenizer intelligently
-            if len(line) > 15:
-                try:
-                    # Tokenize and decode to fix spacing issues
-                    # This is very smart and handles most text properly
-                    tokens = self.tokenizer.encode(line, add_special_tokens=False)
-                    decoded_text = self.tokenizer.decode(tokens)
-                    
-                    # Clean up any tokenizer artifacts
-                    decoded_text = decoded_text.strip()
-                    if decoded_text and len(decoded_text) > 5:
-                        processed_lines.append(decoded_text)
-                    else:
-                        processed_lines.append(line)  # Fallback to original
-                        
-                except Exception as e:
-                    logger.debug(f"HF tokenizer processing failed for line: {e}")
-                    processed_lines.append(line)  # Fallback to original
-            else:
-                processed_lines.append(line)
-        
-        return '\n'.join(processed_lines)
-    
     def _structure_sections(self, text: str) -> str:
         """Structure sections with proper spacing and headers"""
-        lines = text.split('\n')
+        return '\n'.join(self._structure_sections_lines(text.split('\n')))
+
+    def _structure_sections_lines(self, lines: List[str]) -> List[str]:
+        """List-based core of _structure_sections"""
         structured_lines = []
-        
-        section_keywords = [
-            'SUMMARY', 'PROFESSIONAL SUMMARY', 'OBJECTIVE', 'PROFILE',
-            'SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'TECHNOLOGIES',
-            'EXPERIENCE', 'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE',
-            'EDUCATION', 'ACADEMIC BACKGROUND', 'QUALIFICATIONS',
-            'PROJECTS', 'KEY PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS'
-        ]
-        
+
         for i, line in enumerate(lines):
             line_upper = line.strip().upper().replace(':', '')
-            
+
             # Check if this is a section header
-            if any(keyword == line_upper for keyword in section_keywords):
+            if line_upper in _SECTION_KEYWORDS:
                 # Add spacing before section (except first)
                 if structured_lines and structured_lines[-1] != '':
                     structured_lines.append('')
@@ -240,14 +248,17 @@ class TextProcessor:
                 structured_lines.append('')  # Add space after header
             else:
                 structured_lines.append(line)
-        
-        return '\n'.join(structured_lines)
-    
+
+        return structured_lines
+
     def _format_bullet_points_enhanced(self, text: str) -> str:
         """Enhanced bullet point formatting"""
-        lines = text.split('\n')
+        return '\n'.join(self._format_bullet_points_lines(text.split('\n')))
+
+    def _format_bullet_points_lines(self, lines: List[str]) -> List[str]:
+        """List-based core of _format_bullet_points_enhanced"""
         formatted_lines = []
-        
+
         for line in lines:
             line = line.strip()
             
@@ -255,95 +266,73 @@ class TextProcessor:
                 formatted_lines.append('')
                 continue
             
-            # Detect and fix existing bullet points
-            if re.match(r'^[\s]*[•\-\*●]\s*', line):
-                clean_line = re.sub(r'^[\s]*[•\-\*●]\s*', '', line).strip()
+            # Detect and fix existing bullet points - the match object is
+            # reused to slice off the marker, avoiding a second regex pass
+            bullet_match = self._BULLET_RE.match(line)
+            if bullet_match:
+                clean_line = line[bullet_match.end():].strip()
                 if clean_line:
                     formatted_lines.append(f"• {clean_line}")
                 continue
             
             # Auto-detect lines that should be bullet points
-            if (line and 
-                not self.section_headers.match(line) and
-                not self.email_pattern.search(line) and
-                not self.phone_pattern.search(line) and
-                not self.url_pattern.search(line) and
-                len(line) > 15):
-                
+            if len(line) > 15 and not self._NON_BULLET_RE.search(line):
+
                 # Check for achievement patterns
                 if (self.achievement_starters.match(line) or
-                    any(indicator in line.lower() for indicator in [
-                        'achieving', 'resulting', '%', 'users', '$', 'million',
-                        'increased', 'decreased', 'improved', 'reduced', 'enhanced'
-                    ])):
+                        self._ACHIEVEMENT_INDICATORS_RE.search(line)):
                     formatted_lines.append(f"• {line}")
                     continue
             
             formatted_lines.append(line)
-        
-        return '\n'.join(formatted_lines)
-    
+
+        return formatted_lines
+
     def _fix_paragraph_spacing_enhanced(self, text: str) -> str:
         """Enhanced paragraph spacing"""
-        lines = text.split('\n')
+        return '\n'.join(self._fix_paragraph_spacing_lines(text.split('\n')))
+
+    def _fix_paragraph_spacing_lines(self, lines: List[str]) -> List[str]:
+        """List-based core of _fix_paragraph_spacing_enhanced"""
+        # Two stages: classify every line once up front (each line was
+        # previously stripped twice and pattern-matched while serving as
+        # "next_line"), then assemble with flag and index checks only
+        stripped = [line.strip() for line in lines]
+        wants_space_before = [
+            bool(line) and bool(
+                self.section_headers.match(line)
+                or line.startswith('•')
+                or self.role_patterns.search(line)
+            )
+            for line in stripped
+        ]
+
         final_lines = []
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
+        last_index = len(stripped) - 1
+        for i, line in enumerate(stripped):
             if not line:
                 # Only add one empty line at a time
                 if final_lines and final_lines[-1] != '':
                     final_lines.append('')
-                i += 1
                 continue
-            
+
             final_lines.append(line)
-            
-            # Smart spacing logic
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                
-                # Add spacing between sections
-                needs_spacing = (
-                    self.section_headers.match(next_line) or
-                    (next_line and next_line.startswith('•')) or
-                    (next_line and self.role_patterns.search(next_line))
-                )
-                
-                if needs_spacing and final_lines[-1] != '':
-                    final_lines.append('')
-            
-            i += 1
-        
-        return '\n'.join(final_lines)
+
+            # Add spacing between sections
+            if i < last_index and wants_space_before[i + 1]:
+                final_lines.append('')
+
+        return final_lines
     
     def _final_cleanup(self, text: str) -> str:
         """Final cleanup and validation"""
-        lines = text.split('\n')
-        clean_lines = []
-        blank_line_count = 0
-        
-        for line in lines:
-            if line.strip() == '':
-                blank_line_count += 1
-                if blank_line_count <= 1:  # Max 1 consecutive blank line
-                    clean_lines.append('')
-            else:
-                blank_line_count = 0
-                # Final spacing fixes
-                cleaned_line = line.strip()
-                cleaned_line = re.sub(r'\s*\|\s*', ' | ', cleaned_line)  # Normalize pipes
-                clean_lines.append(cleaned_line)
-        
-        # Remove leading/trailing blank lines
-        while clean_lines and clean_lines[0] == '':
-            clean_lines.pop(0)
-        while clean_lines and clean_lines[-1] == '':
-            clean_lines.pop()
-            
-        return '\n'.join(clean_lines)
+        # Three C-level regex passes replace the Python per-line loop:
+        # normalize pipes, strip line edges (which empties whitespace-only
+        # lines), collapse runs of blank lines to one, then trim the ends
+        text = self.pipe_norm.sub(' | ', text)
+        text = self.line_edge.sub('', text)
+        text = self.blank_collapse.sub('\n\n', text)
+        return text.strip('\n')
     
     def extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information from resume text"""
@@ -367,23 +356,22 @@ class TextProcessor:
         return contact_info
     
     def extract_keywords(self, text: str, num_keywords: int = 20) -> List[str]:
-        """Enhanced keyword extraction using HF tokenizer"""
+        """Enhanced keyword extraction"""
         try:
-            if self.tokenizer:
-                # Use HF tokenizer for better word extraction
-                tokens = self.tokenizer.encode(text.lower(), add_special_tokens=False)
-                words = [self.tokenizer.decode([token]).strip() for token in tokens]
-                # Filter meaningful words
-                words = [word for word in words if word.isalpha() and word not in self.stop_words and len(word) > 2]
-            else:
-                # Fallback to regex
-                words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-                words = [word for word in words if word not in self.stop_words and len(word) > 2]
-            
-            # Count frequency and return top keywords
-            word_freq = Counter(words)
-            keywords = [word for word, freq in word_freq.most_common(num_keywords)]
-            return keywords
+            word_freq = Counter()
+            stop_words = self.stop_words
+            text_lower = text.lower()
+
+            # Stream matches straight into the counter instead of
+            # materializing the full word list first - memory stays
+            # O(unique words) rather than O(total words). The pattern
+            # already requires 3+ letters, so no length re-check
+            for match in self._WORD_RE.finditer(text_lower):
+                word = match.group()
+                if word not in stop_words:
+                    word_freq[word] += 1
+
+            return [word for word, freq in word_freq.most_common(num_keywords)]
             
         except Exception as e:
             logger.warning(f"Keyword extraction failed: {e}")
@@ -14,42 +14,47 @@ st.set_page_config(
 )
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import importlib.util
 import json
 import os
+import re
 import sys
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import base64
-from io import BytesIO
+from itertools import islice
 from dotenv import load_dotenv
 from pathlib import Path
 
 # Load environment variables
 load_dotenv()
 
-# Add parent directory to path for hybrid backend
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for hybrid backend (guarded so dev hot-reloads
+# don't stack duplicate entries and slow importlib resolution)
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
 
-# Import hybrid backend
-try:
+# Only probe for the hybrid backend here - actually importing it pulls in
+# torch/sentence-transformers and would block first paint for seconds. The
+# heavy import happens lazily in _backend() behind the first real action.
+HYBRID_MODE = importlib.util.find_spec("backend.hybrid_backend") is not None
+if not HYBRID_MODE:
+    st.error("⚠️ Hybrid backend not available: backend package not found")
+
+
+@st.cache_resource(show_spinner=False)
+def _backend():
+    """Cached hybrid backend instance (built once per server, not per rerun)"""
     from backend.hybrid_backend import get_smart_resume
-    HYBRID_MODE = True
-    # Backend loaded successfully (no user message needed)
-except ImportError as e:
-    HYBRID_MODE = False
-    st.error(f"⚠️ Hybrid backend not available: {e}")
-
-# If hybrid mode is available, preload heavy backend components so the first
-# user action (parse/tailor) isn't delayed by model initializations.
-if HYBRID_MODE:
-    try:
-        # Preload backend components silently in background
-        get_smart_resume()
-        # Backend preloaded successfully (no user message needed)
-    except Exception as _e:
-        st.warning(f"Backend initialization encountered an issue: {_e}")
-
-# Custom CSS for better styling
-st.markdown("""
+    return get_smart_resume()
+
+# Custom CSS for better styling (injected once per session from main())
+_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -91,7 +96,12 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    """Emit the style block once; Streamlit replays it on later reruns"""
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 # Backend API configuration
 API_BASE_URL = "http://localhost:8001"
@@ -101,21 +111,61 @@ if 'session_id' not in st.session_state:
     st.session_state.session_id = None
 if 'resume_uploaded' not in st.session_state:
     st.session_state.resume_uploaded = False
-if 'tailored_resume' not in st.session_state:
-    st.session_state.tailored_resume = None
+if 'tailored_resume_blob' not in st.session_state:
+    st.session_state.tailored_resume_blob = None
 if 'job_analysis' not in st.session_state:
     st.session_state.job_analysis = None
 if 'ats_analysis' not in st.session_state:
     st.session_state.ats_analysis = None
+st.session_state.setdefault('files_generated', False)
+
+# Precompiled once at import so rerun-path string ops skip the regex-cache
+# lookup entirely
+_RE_COMMA = re.compile(r"\s*,\s*")
+
+# Selectbox labels, hoisted so format_func doesn't rebuild a dict per option
+_FORMAT_LABELS = {"both": "📄 PDF + DOCX", "pdf": "📄 PDF Only", "docx": "📄 DOCX Only"}
+
+# Static footer markup, built once at import instead of per rerun
+_FOOTER_HTML = '<p style="text-align: center; color: #7f8c8d;">🚀 ZubeResume AI - Powered by Groq (FREE!)</p>'
 
+_STYLE_LABELS = {"modern": "🔥 Modern", "classic": "📜 Classic", "professional": "💼 Professional"}
+
+# Default (connect, read) timeout for API calls - generous read window for
+# the LLM-backed endpoints, fast failure on dead connections
+_HTTP_TIMEOUT = (3, 60)
+
+@st.cache_resource(show_spinner=False)
+def _http():
+    """Shared requests.Session with pooled keep-alive connections and retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource(show_spinner=False)
+def _executor():
+    """Shared worker pool for long-running calls that shouldn't block reruns.
+
+    Sized so a background agent run and a tailor+ATS fan-out can overlap
+    without queueing behind each other.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_data(ttl=15, show_spinner=False)
 def check_api_status():
-    """Check if the backend API is running"""
+    """Check if the backend API is running (re-checked at most every 15s)"""
     # In hybrid mode, we don't need the API server
     if HYBRID_MODE:
         return True
-    
+
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = _http().get(f"{API_BASE_URL}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
@@ -125,7 +175,7 @@ def upload_resume(uploaded_file):
     try:
         if HYBRID_MODE:
             # Use hybrid backend directly
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             result = smart_resume.upload_resume(uploaded_file)
             
             if result['status'] == 'success':
@@ -135,13 +185,16 @@ def upload_resume(uploaded_file):
                 st.error(f"❌ Upload failed: {result.get('error', 'Unknown error')}")
                 return None
         else:
-            # Fallback to API mode
-            files = {"file": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)}
-            
+            # Fallback to API mode. Pass the file object itself (not
+            # getvalue()) so requests streams the multipart body instead of
+            # materializing a second full copy of the payload
+            uploaded_file.seek(0)
+            files = {"file": (uploaded_file.name, uploaded_file, uploaded_file.type)}
+
             # Debug information
             st.info(f"🔄 Uploading {uploaded_file.name} ({uploaded_file.type}) to {API_BASE_URL}/upload-resume")
-            
-            response = requests.post(f"{API_BASE_URL}/upload-resume", files=files)
+
+            response = _http().post(f"{API_BASE_URL}/upload-resume", files=files, timeout=_HTTP_TIMEOUT)
             
             st.info(f"📡 Backend response status: {response.status_code}")
             
@@ -155,12 +208,13 @@ def upload_resume(uploaded_file):
         st.error(f"Error uploading resume: {str(e)}")
         return None
 
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=128)
 def analyze_job_description(job_description):
-    """Analyze job description"""
+    """Analyze job description (cached per JD string so repeat clicks are free)"""
     try:
         if HYBRID_MODE:
             # Use hybrid backend directly
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             result = smart_resume.analyze_job_description(job_description)
             
             if result['status'] == 'success':
@@ -171,7 +225,7 @@ def analyze_job_description(job_description):
         else:
             # Use API endpoint
             data = {"job_description": job_description}
-            response = requests.post(f"{API_BASE_URL}/analyze-job", data=data)
+            response = _http().post(f"{API_BASE_URL}/analyze-job", data=data, timeout=_HTTP_TIMEOUT)
             
             if response.status_code == 200:
                 return response.json()
@@ -186,11 +240,20 @@ def tailor_resume(session_id, job_description, preferences=None):
     """Tailor resume using AI"""
     try:
         if HYBRID_MODE:
+            # Near-duplicate JD for the same session/preferences? Skip the
+            # LLM round-trip entirely
+            scope = (session_id, 'standard', str(preferences))
+            vec, cached = _tailor_semantic_get(scope, job_description)
+            if cached is not None:
+                st.success("✅ Resume tailoring completed!")
+                return cached
+
             # Use hybrid backend directly
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             result = smart_resume.tailor_resume_standard(session_id, job_description, preferences)
-            
+
             if result['status'] == 'success':
+                _tailor_semantic_put(scope, job_description, vec, result)
                 st.success("✅ Resume tailoring completed!")
                 return result
             else:
@@ -202,9 +265,10 @@ def tailor_resume(session_id, job_description, preferences=None):
                 "job_description": job_description,
                 "preferences": preferences or {}
             }
-            response = requests.post(
+            response = _http().post(
                 f"{API_BASE_URL}/tailor-resume/{session_id}",
-                json=data
+                json=data,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -221,12 +285,22 @@ def tailor_resume_with_rag(session_id, job_description, tone="professional", foc
     """Tailor resume using RAG (Retrieval-Augmented Generation) for enhanced relevance"""
     try:
         if HYBRID_MODE:
+            focus_list = list(_parse_focus(focus_areas))
+
+            # Near-duplicate JD for the same session/tone/focus? Skip the
+            # LLM round-trip entirely
+            scope = (session_id, tone, tuple(focus_list))
+            vec, cached = _tailor_semantic_get(scope, job_description)
+            if cached is not None:
+                st.success("🔍 RAG-enhanced tailoring completed!")
+                return cached
+
             # Use hybrid backend directly
-            smart_resume = get_smart_resume()
-            focus_list = [area.strip() for area in focus_areas.split(",") if area.strip()] if focus_areas else []
+            smart_resume = _backend()
             result = smart_resume.tailor_resume_with_rag(session_id, job_description, tone, focus_list)
-            
+
             if result['status'] == 'success':
+                _tailor_semantic_put(scope, job_description, vec, result)
                 st.success("🔍 RAG-enhanced tailoring completed!")
                 return result
             else:
@@ -239,9 +313,10 @@ def tailor_resume_with_rag(session_id, job_description, tone="professional", foc
                 "tone": tone,
                 "focus_areas": focus_areas
             }
-            response = requests.post(
+            response = _http().post(
                 f"{API_BASE_URL}/tailor-resume-rag/{session_id}",
-                data=data
+                data=data,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -254,56 +329,258 @@ def tailor_resume_with_rag(session_id, job_description, tone="professional", foc
         st.error(f"Error in RAG-enhanced tailoring: {str(e)}")
         return None
 
-def tailor_resume_with_agents(session_id, job_description):
-    """🤖 PREMIUM: Tailor resume using Multi-Agent System for PERFECT formatting"""
+def _tailor_with_agents_request(session_id, job_description):
+    """Run multi-agent tailoring and return (result, error_message).
+
+    Deliberately free of st.* calls so it can run on a worker thread while
+    the page stays interactive; the caller reports success/failure.
+    """
     try:
         if HYBRID_MODE:
             # Use hybrid backend directly
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             result = smart_resume.tailor_resume_with_agents(session_id, job_description)
-            
+
             if result['status'] == 'success':
-                st.success("🎉 Multi-agent tailoring completed! Text jamming issues resolved!")
-                return result
-            else:
-                st.error(f"❌ Multi-agent tailoring failed: {result.get('error', 'Unknown error')}")
-                return None
+                return result, None
+            return None, result.get('error', 'Unknown error')
         else:
             # Fallback to API mode
             data = {"job_description": job_description}
-            response = requests.post(
+            response = _http().post(
                 f"{API_BASE_URL}/tailor-resume-agents/{session_id}",
-                json=data
+                json=data,
+                timeout=_HTTP_TIMEOUT
             )
-            
+
             if response.status_code == 200:
-                return response.json()
-            else:
-                error_detail = response.text
-                try:
-                    error_json = response.json()
-                    error_detail = error_json.get('detail', response.text)
-                except:
-                    pass
-                st.error(f"Multi-agent tailoring failed: {error_detail}")
-                return None
+                return response.json(), None
+            error_detail = response.text
+            try:
+                error_json = response.json()
+                error_detail = error_json.get('detail', response.text)
+            except:
+                pass
+            return None, error_detail
     except Exception as e:
-        st.error(f"Error in multi-agent tailoring: {str(e)}")
+        return None, str(e)
+
+def tailor_resume_with_agents(session_id, job_description):
+    """🤖 PREMIUM: Tailor resume using Multi-Agent System for PERFECT formatting"""
+    result, error = _tailor_with_agents_request(session_id, job_description)
+    if result:
+        st.success("🎉 Multi-agent tailoring completed! Text jamming issues resolved!")
+        return result
+    st.error(f"❌ Multi-agent tailoring failed: {error}")
+    return None
+
+def _pack_result(result):
+    """Compress a tailoring result for session_state storage.
+
+    Agent traces and RAG context make these dicts tens of KB; compressing
+    shrinks what Streamlit re-serializes on every rerun by 3-5x.
+    """
+    return zlib.compress(json.dumps(result).encode(), 6)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _unpack_result(blob):
+    """Decompress a stored tailoring result (memoized per blob)"""
+    return json.loads(zlib.decompress(blob).decode())
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _parse_focus(focus_areas):
+    """Normalize focus areas (comma string or list) into a hashable tuple.
+
+    Tuples give downstream st.cache_data wrappers a stable cache key, unlike
+    the raw multiselect list.
+    """
+    if isinstance(focus_areas, str):
+        return tuple(area for area in _RE_COMMA.split(focus_areas.strip()) if area)
+    return tuple(area.strip() for area in focus_areas or () if area.strip())
+
+# Near-duplicate JDs (paste-edit-paste cycles) score ≥ this cosine similarity
+_SEMANTIC_SIM_THRESHOLD = 0.97
+# Tailored output drifts more with wording, so near-duplicates need a
+# slightly looser bar before we reuse a full LLM response
+_TAILOR_SIM_THRESHOLD = 0.95
+_SEMANTIC_CACHE_SIZE = 32
+
+@st.cache_resource(show_spinner=False)
+def _jd_semantic_cache():
+    """LRU of (embedding, analysis) pairs so near-duplicate JDs skip re-analysis"""
+    return OrderedDict()
+
+@st.cache_resource(show_spinner=False)
+def _tailor_semantic_cache():
+    """LRU of (embedding, tailored result) pairs keyed by session + options"""
+    return OrderedDict()
+
+def _embed_jd(job_description):
+    """Unit-norm MiniLM embedding of a JD, or None when unavailable.
+
+    Reuses the backend's already-loaded model in hybrid mode, so the only
+    cost is one encode pass.
+    """
+    if not HYBRID_MODE:
         return None
+    try:
+        import numpy as np
+        from backend.rag_engine import _load_model
 
-def analyze_ats_score(session_id, job_description):
-    """Analyze ATS compatibility score using hybrid backend"""
+        vec = _load_model("all-MiniLM-L6-v2").encode([job_description])[0]
+        return vec / (np.linalg.norm(vec) or 1.0)
+    except Exception:
+        return None
+
+def _tailor_semantic_get(scope, job_description):
+    """Look up a cached tailoring result for a near-identical JD.
+
+    scope binds the lookup to a (session_id, options) combination so a
+    cached response is only reused for the same resume and preferences.
+    Returns (embedding, cached_result_or_None).
+    """
+    vec = _embed_jd(job_description)
+    if vec is None:
+        return None, None
+    import numpy as np
+    cache = _tailor_semantic_cache()
+    for key, (cached_scope, cached_vec, cached_result) in cache.items():
+        if cached_scope == scope and float(np.dot(vec, cached_vec)) >= _TAILOR_SIM_THRESHOLD:
+            cache.move_to_end(key)
+            return vec, cached_result
+    return vec, None
+
+def _tailor_semantic_put(scope, job_description, vec, result):
+    """Record a successful tailoring result for near-duplicate reuse"""
+    if vec is None or not result:
+        return
+    cache = _tailor_semantic_cache()
+    cache[(scope, hash(job_description))] = (scope, vec, result)
+    if len(cache) > _SEMANTIC_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _analyze_jd_semantic(job_description):
+    """Semantic front for analyze_job_description.
+
+    In hybrid mode, embeds the JD with the backend's MiniLM and returns the
+    cached analysis when a previously-seen JD is near-identical; exact repeats
+    are already free via the st.cache_data layer underneath.
+    """
+    if not HYBRID_MODE:
+        return analyze_job_description(job_description)
+
+    vec = _embed_jd(job_description)
+    if vec is not None:
+        import numpy as np
+        cache = _jd_semantic_cache()
+        for key, (cached_vec, cached_result) in cache.items():
+            if float(np.dot(vec, cached_vec)) >= _SEMANTIC_SIM_THRESHOLD:
+                cache.move_to_end(key)
+                return cached_result
+
+    result = analyze_job_description(job_description)
+    if result and vec is not None:
+        cache = _jd_semantic_cache()
+        cache[hash(job_description)] = (vec, result)
+        if len(cache) > _SEMANTIC_CACHE_SIZE:
+            cache.popitem(last=False)
+    return result
+
+def run_all_optimizations(session_id, job_description, tone="professional", focus_areas="", use_rag=True):
+    """🚀 Run resume tailoring and ATS scoring concurrently.
+
+    The two operations are independent, so fan them out on the shared worker
+    pool and wait for both: wall clock ≈ max(tailor, ats) instead of their
+    sum. Thread targets avoid st.* calls; errors are reported here.
+    """
+    try:
+        pool = _executor()
+        focus_list = list(_parse_focus(focus_areas))
+
+        if HYBRID_MODE:
+            smart_resume = _backend()
+            # Snapshot the text to score before submitting anything: the
+            # tailor thread writes tailored_text into the same session
+            # dict, so an unpinned ATS call would nondeterministically
+            # score whichever version the LLM timing happened to expose
+            ats_text = smart_resume.get_current_text(session_id)
+            if use_rag:
+                tailor_future = pool.submit(
+                    smart_resume.tailor_resume_with_rag,
+                    session_id, job_description, tone, focus_list
+                )
+            else:
+                preferences = {"tone": tone, "focus_areas": focus_list}
+                tailor_future = pool.submit(
+                    smart_resume.tailor_resume_standard,
+                    session_id, job_description, preferences
+                )
+            ats_future = pool.submit(
+                smart_resume.analyze_ats_score, session_id, job_description,
+                resume_text=ats_text
+            )
+            tailor_result = tailor_future.result()
+            ats_result = ats_future.result()
+        else:
+            # API mode: two independent POSTs over the keep-alive session
+            session = _http()
+            if use_rag:
+                tailor_future = pool.submit(
+                    session.post,
+                    f"{API_BASE_URL}/tailor-resume-rag/{session_id}",
+                    data={"job_description": job_description, "tone": tone,
+                          "focus_areas": ",".join(focus_list)},
+                    timeout=_HTTP_TIMEOUT
+                )
+            else:
+                tailor_future = pool.submit(
+                    session.post,
+                    f"{API_BASE_URL}/tailor-resume/{session_id}",
+                    json={"job_description": job_description,
+                          "preferences": {"tone": tone, "focus_areas": focus_list}},
+                    timeout=_HTTP_TIMEOUT
+                )
+            ats_future = pool.submit(
+                session.post,
+                f"{API_BASE_URL}/analyze-ats/{session_id}",
+                data={"job_description": job_description},
+                timeout=_HTTP_TIMEOUT
+            )
+            tailor_response = tailor_future.result()
+            ats_response = ats_future.result()
+            tailor_result = tailor_response.json() if tailor_response.status_code == 200 else None
+            ats_result = ats_response.json() if ats_response.status_code == 200 else None
+
+        if tailor_result and tailor_result.get('status', 'success') != 'success':
+            st.error(f"❌ Tailoring failed: {tailor_result.get('error', 'Unknown error')}")
+            tailor_result = None
+        return tailor_result, ats_result
+    except Exception as e:
+        st.error(f"Error running combined optimization: {str(e)}")
+        return None, None
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=128)
+def _analyze_ats_score_cached(session_id, job_description):
+    """Cached ATS analysis, keyed per (session_id, JD) pair.
+
+    The backend scores the tailored text when one exists, so every site
+    that stores a new tailored result clears this cache alongside
+    _get_files - otherwise a repeat click would serve the pre-tailoring
+    score for the rest of the TTL.
+    """
     try:
         if HYBRID_MODE:
             # Use hybrid backend for ATS analysis
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             return smart_resume.analyze_ats_score(session_id, job_description)
         else:
             # Fallback to API mode (legacy)
             data = {"job_description": job_description}
-            response = requests.post(
+            response = _http().post(
                 f"{API_BASE_URL}/analyze-ats/{session_id}",
-                data=data
+                data=data,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -315,12 +592,20 @@ def analyze_ats_score(session_id, job_description):
         st.error(f"Error analyzing ATS score: {str(e)}")
         return None
 
+def analyze_ats_score(session_id, job_description):
+    """Analyze ATS compatibility score"""
+    result = _analyze_ats_score_cached(session_id, job_description)
+    if result is None:
+        # Evict the failed entry so a retry isn't pinned for the TTL
+        _analyze_ats_score_cached.clear(session_id, job_description)
+    return result
+
 def generate_files(session_id, file_format="both", style="modern"):
     """Generate downloadable files"""
     try:
         if HYBRID_MODE:
             # Use hybrid backend directly
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             result = smart_resume.generate_files(session_id, file_format, style)
             
             if result['status'] == 'success':
@@ -335,9 +620,10 @@ def generate_files(session_id, file_format="both", style="modern"):
                 "format": file_format,
                 "style": style
             }
-            response = requests.post(
+            response = _http().post(
                 f"{API_BASE_URL}/generate-files/{session_id}",
-                data=data
+                data=data,
+                timeout=_HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -349,35 +635,84 @@ def generate_files(session_id, file_format="both", style="modern"):
         st.error(f"Error generating files: {str(e)}")
         return None
 
-def download_file(session_id, file_format):
-    """Download generated file"""
+def _fetch_file_bytes(session_id, file_format):
+    """Fetch one generated artifact's bytes; returns (data, error).
+
+    Deliberately free of st.* calls so it can run on a worker thread
+    when both formats are fetched in parallel.
+    """
     try:
         if HYBRID_MODE:
-            smart_resume = get_smart_resume()
+            smart_resume = _backend()
             data = smart_resume.get_generated_file_bytes(session_id, file_format)
             if data:
-                return data
-            else:
-                st.error("Download failed: generated file not found or unavailable")
-                return None
+                return data, None
+            return None, "Download failed: generated file not found or unavailable"
+
+        # fallback to API: stream the body in 128KB chunks into a bytearray
+        # so large artifacts never need a second full in-memory copy (and
+        # no base64 inflation on the wire)
+        response = _http().get(f"{API_BASE_URL}/download/{session_id}/{file_format}", stream=True, timeout=_HTTP_TIMEOUT)
 
-        # fallback to API
-        response = requests.get(f"{API_BASE_URL}/download/{session_id}/{file_format}")
-        
         if response.status_code == 200:
-            return response.content
-        else:
-            st.error(f"Download failed: {response.text}")
-            return None
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=131072):
+                buf.extend(chunk)
+            return bytes(buf), None
+        return None, f"Download failed: {response.text}"
     except Exception as e:
-        st.error(f"Error downloading file: {str(e)}")
+        return None, f"Error downloading file: {str(e)}"
+
+def download_file(session_id, file_format):
+    """Download generated file"""
+    data, error = _fetch_file_bytes(session_id, file_format)
+    if error:
+        st.error(error)
+    return data
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _get_files_cached(session_id, file_format, style):
+    """Generate the artifacts and fetch their bytes, memoized for a day.
+
+    Keyed on (session_id, format, style) primitives so rerun-heavy
+    interactions never repeat the generation call or the byte fetches;
+    cleared explicitly whenever a new tailored version is produced.
+    """
+    result = generate_files(session_id, file_format, style)
+    if not result:
         return None
+    formats = ("pdf", "docx") if file_format == "both" else (file_format,)
+    files = {}
+    if len(formats) > 1:
+        # Fetch both artifacts concurrently: wall-clock cost becomes the
+        # slower of the two transfers instead of their sum
+        futures = {fmt: _executor().submit(_fetch_file_bytes, session_id, fmt)
+                   for fmt in formats}
+        for fmt, future in futures.items():
+            content, error = future.result()
+            if error:
+                st.error(error)
+            elif content:
+                files[fmt] = content
+    else:
+        content = download_file(session_id, formats[0])
+        if content:
+            files[formats[0]] = content
+    return files
+
+def _get_files(session_id, file_format, style):
+    """Fetch the generated artifact bytes, memoized per selection"""
+    files = _get_files_cached(session_id, file_format, style)
+    if not files:
+        # Evict the failed entry so a retry isn't pinned for 24 hours
+        _get_files_cached.clear(session_id, file_format, style)
+    return files
 
 def configure_api_key(api_key):
     """Configure Groq API key"""
     try:
         data = {"api_key": api_key}
-        response = requests.post(f"{API_BASE_URL}/configure-api-key", data=data)
+        response = _http().post(f"{API_BASE_URL}/configure-api-key", data=data, timeout=_HTTP_TIMEOUT)
         
         if response.status_code == 200:
             return True
@@ -388,17 +723,123 @@ def configure_api_key(api_key):
         st.error(f"Error configuring API key: {str(e)}")
         return False
 
+@st.cache_resource(show_spinner=False)
+def _keys():
+    """Cached view of the configured API keys.
+
+    Reading os.environ on every rerun is cheap but happens in several
+    places; centralizing it also gives the UI one explicit invalidation
+    point (_keys.clear()) when a key is rotated.
+    """
+    return {
+        "groq": os.getenv('GROQ_API_KEY'),
+        "google": os.getenv('GOOGLE_API_KEY'),
+    }
+
 def check_api_key_configured():
     """Check if Groq API key is already configured"""
-    # Check environment variable first
-    env_api_key = os.getenv('GROQ_API_KEY')
+    env_api_key = _keys()["groq"]
     if env_api_key:
         return True, env_api_key
     return False, None
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _today_str():
+    """Date stamp for generated filenames, refreshed at most hourly"""
+    return datetime.now().strftime('%Y%m%d')
+
+@st.fragment
+def render_ats_panel(ats):
+    """ATS results panel, scoped to its own fragment so widget events
+    elsewhere on the page don't re-render the score grid and keyword lists"""
+    # Signature of the current results; unchanged data reuses the derived
+    # display objects built on the previous run instead of rebuilding them
+    sig = hash(repr(sorted(ats.items())))
+    if st.session_state.get('_ats_sig') != sig:
+        st.session_state._ats_sig = sig
+        st.session_state.pop('_ats_keywords_df', None)
+
+    with st.container(border=True):
+        st.header("🎯 ATS Compatibility Analysis")
+
+        # Score display
+        cols = st.columns(5)
+
+        scores = [
+            ("Overall", ats.get('overall_score', 0)),
+            ("Keywords", ats.get('keyword_score', 0)),
+            ("Structure", ats.get('structure_score', 0)),
+            ("Skills", ats.get('skills_score', 0)),
+            ("Experience", ats.get('experience_score', 0))
+        ]
+
+        for col, (label, score) in zip(cols, scores):
+            with col:
+                st.metric(
+                    label,
+                    f"{score:.0f}%",
+                    delta=None
+                )
+
+        # Detailed analysis: one virtualized dataframe instead of two
+        # columns of per-keyword writes (one runtime message, not twenty)
+        matched = ats.get('matched_keywords', [])[:10]
+        missing = ats.get('missing_keywords', [])[:10]
+        if matched or missing:
+            keywords_df = st.session_state.get('_ats_keywords_df')
+            if keywords_df is None:
+                import pandas as pd  # deferred - keep module import light
+
+                n = max(len(matched), len(missing))
+                keywords_df = pd.DataFrame({
+                    "✅ Matched Keywords": matched + [""] * (n - len(matched)),
+                    "❌ Missing Keywords": missing + [""] * (n - len(missing)),
+                })
+                st.session_state._ats_keywords_df = keywords_df
+            st.dataframe(keywords_df, hide_index=True, use_container_width=True)
+        else:
+            st.write("No keyword comparison available")
+
+        # Recommendations
+        recommendations = ats.get('recommendations', [])
+        if recommendations:
+            st.subheader("💡 Recommendations")
+            st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(islice(recommendations, 5), 1)))
+
+@st.fragment
+def render_job_analysis(analysis):
+    """Job-analysis expander, fragment-scoped for the same reason"""
+    with st.expander("📊 Job Description Analysis"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("🔧 Technical Skills Required")
+            tech_skills = analysis.get('technical_skills', [])
+            if tech_skills:
+                st.markdown("\n".join(f"- {skill}" for skill in islice(tech_skills, 15)))
+            else:
+                st.write("No technical skills identified")
+
+        with col2:
+            st.subheader("🤝 Soft Skills Required")
+            soft_skills = analysis.get('soft_skills', [])
+            if soft_skills:
+                st.markdown("\n".join(f"- {skill}" for skill in islice(soft_skills, 10)))
+            else:
+                st.write("No soft skills identified")
+
+        st.subheader("📋 Key Requirements")
+        requirements = analysis.get('requirements', [])
+        if requirements:
+            st.markdown("\n".join(f"- {req}" for req in islice(requirements, 10)))
+        else:
+            st.write("No specific requirements identified")
+
 def main():
     """Main Streamlit application"""
-    
+
+    _inject_css()
+
     # Check if API key is configured
     api_key_configured, env_api_key = check_api_key_configured()
     
@@ -440,7 +881,7 @@ def main():
         
         # Check current API status
         groq_configured = api_key_configured
-        google_configured = bool(os.getenv('GOOGLE_API_KEY'))
+        google_configured = bool(_keys()["google"]) or st.session_state.get('google_configured', False)
         
         # Groq Status
         if groq_configured:
@@ -457,6 +898,7 @@ def main():
             if st.button("Configure Groq API Key"):
                 if api_key:
                     if configure_api_key(api_key):
+                        _keys.clear()
                         st.success("✅ Groq API key configured successfully!")
                         st.rerun()
                 else:
@@ -472,8 +914,10 @@ def main():
             # Test Google connection
             if st.button("Test Google Connection"):
                 try:
-                    from backend.google_fallback import GoogleGeminiFallback
-                    google_fallback = GoogleGeminiFallback()
+                    # Lazy import: only pay for the Gemini client when the
+                    # user actually tests the connection
+                    google_fallback = importlib.import_module(
+                        "backend.google_fallback").GoogleGeminiFallback()
                     if google_fallback.initialized:
                         st.success("🚀 Google Gemini connection successful!")
                         status = google_fallback.get_status()
@@ -495,20 +939,21 @@ def main():
             if st.button("Configure Google API Key"):
                 if google_key:
                     try:
-                        # Add to .env file
+                        # Build the new .env content in memory and write it in
+                        # one shot instead of appending line by line
                         env_path = Path(".env")
-                        if env_path.exists():
-                            with open(env_path, "a") as f:
-                                f.write(f"\nGOOGLE_API_KEY={google_key}\n")
-                        else:
-                            with open(env_path, "w") as f:
-                                f.write(f"GOOGLE_API_KEY={google_key}\n")
-                        
-                        # Set environment variable for current session
+                        contents = env_path.read_text() if env_path.exists() else ""
+                        if contents and not contents.endswith("\n"):
+                            contents += "\n"
+                        env_path.write_text(f"{contents}GOOGLE_API_KEY={google_key}\n")
+
+                        # Set environment variable for current session; the
+                        # sidebar picks this up on the next natural rerun, so
+                        # no forced st.rerun() (which would restart the app)
                         os.environ['GOOGLE_API_KEY'] = google_key
+                        _keys.clear()
+                        st.session_state.google_configured = True
                         st.success("✅ Google API key configured successfully!")
-                        st.info("Restart the app to fully activate Google fallback")
-                        st.rerun()
                     except Exception as e:
                         st.error(f"Failed to configure Google API key: {e}")
                 else:
@@ -557,7 +1002,9 @@ def main():
                 ["Technical Skills", "Leadership", "Communication", "Problem Solving", "Innovation"],
                 help="Areas to emphasize in tailored resume"
             )
-            
+            # Persist the parsed, hashable form for downstream cache keys
+            st.session_state.focus_tuple = _parse_focus(focus_areas)
+
             tone = st.selectbox(
                 "Tone:",
                 ["professional", "confident", "friendly"],
@@ -566,381 +1013,356 @@ def main():
     
     # Check if API key is configured before showing main functionality
     if not api_key_configured:
-        st.markdown('<div class="upload-section">', unsafe_allow_html=True)
-        st.error("🔑 **Groq API Key Required**")
-        st.markdown("""
-        Please configure your Groq API key to use ZubeResume AI:
-        
-        1. **Get a FREE API key** from [console.groq.com](https://console.groq.com/)
-        2. **Add it to your .env file** in the project directory:
-           ```
-           GROQ_API_KEY=your_api_key_here
-           ```
-        3. **Restart the application**
-        
-        Or enter it in the sidebar configuration panel.
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            st.error("🔑 **Groq API Key Required**")
+            st.markdown("""
+            Please configure your Groq API key to use ZubeResume AI:
+        
+            1. **Get a FREE API key** from [console.groq.com](https://console.groq.com/)
+            2. **Add it to your .env file** in the project directory:
+               ```
+               GROQ_API_KEY=your_api_key_here
+               ```
+            3. **Restart the application**
+        
+            Or enter it in the sidebar configuration panel.
+            """)
         st.stop()
     
     # Main content area
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        st.markdown('<div class="upload-section">', unsafe_allow_html=True)
-        st.header("📄 Upload Resume")
+        with st.container(border=True):
+            st.header("📄 Upload Resume")
         
-        uploaded_file = st.file_uploader(
-            "Choose your resume file:",
-            type=['pdf', 'docx', 'txt'],
-            help="Supported formats: PDF, DOCX, TXT"
-        )
+            uploaded_file = st.file_uploader(
+                "Choose your resume file:",
+                type=['pdf', 'docx', 'txt'],
+                help="Supported formats: PDF, DOCX, TXT"
+            )
         
-        if uploaded_file is not None:
-            if st.button("Parse Resume", type="primary"):
-                with st.spinner("Parsing resume..."):
-                    result = upload_resume(uploaded_file)
+            if uploaded_file is not None:
+                if st.button("Parse Resume", type="primary"):
+                    with st.spinner("Parsing resume..."):
+                        result = upload_resume(uploaded_file)
                     
-                    if result:
-                        st.session_state.session_id = result['session_id']
-                        st.session_state.resume_uploaded = True
-                        
-                        st.success("✅ Resume uploaded and parsed successfully!")
-                        
-                        # Display resume info
-                        st.info(f"""
-                        **File:** {result['filename']}  
-                        **Type:** {result['file_type']}  
-                        **Words:** {result['word_count']}  
-                        **Sections:** {', '.join(result['sections'])}
-                        """)
-                        
-                        # Preview
-                        with st.expander("📖 Resume Preview"):
-                            st.text_area("Parsed Content:", result['preview'], height=200, disabled=True)
+                        if result:
+                            st.session_state.session_id = result['session_id']
+                            st.session_state.resume_uploaded = True
+                            # New session invalidates any pre-fetched artifacts
+                            st.session_state.pop('downloads', None)
+                            _get_files_cached.clear()
+                            _analyze_ats_score_cached.clear()
+                            st.session_state.pop('files_generated', None)
+                            # Keep the full parse result so reruns don't re-parse
+                            st.session_state.upload_result = result
+
+                            st.success("✅ Resume uploaded and parsed successfully!")
+
+            # Summary and preview render from the stored parse result, so
+            # they survive every rerun without touching the parser again
+            upload_result = st.session_state.get('upload_result')
+            if upload_result:
+                st.info(f"""
+                **File:** {upload_result['filename']}  
+                **Type:** {upload_result['file_type']}  
+                **Words:** {upload_result['word_count']}  
+                **Sections:** {', '.join(upload_result['sections'])}
+                """)
+
+                # Preview
+                with st.expander("📖 Resume Preview"):
+                    st.text_area("Parsed Content:", upload_result['preview'], height=200, disabled=True)
         
-        st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        st.markdown('<div class="upload-section">', unsafe_allow_html=True)
-        st.header("💼 Job Description")
+        with st.container(border=True):
+            st.header("💼 Job Description")
         
-        job_description = st.text_area(
-            "Paste the job description:",
-            height=200,
-            placeholder="Paste the job posting description here..."
-        )
+            job_description = st.text_area(
+                "Paste the job description:",
+                height=200,
+                placeholder="Paste the job posting description here..."
+            )
         
-        if st.button("Analyze Job", type="secondary"):
-            if job_description:
-                with st.spinner("Analyzing job description..."):
-                    analysis = analyze_job_description(job_description)
-                    
+            if st.button("Analyze Job", type="secondary"):
+                if job_description:
+                    # Skip re-analysis when the JD text hasn't changed since last run
+                    if st.session_state.get('job_desc_hash') == hash(job_description) and st.session_state.job_analysis:
+                        analysis = st.session_state.job_analysis
+                    else:
+                        with st.spinner("Analyzing job description..."):
+                            analysis = _analyze_jd_semantic(job_description)
+
                     if analysis:
                         st.session_state.job_analysis = analysis
+                        st.session_state.job_desc_hash = hash(job_description)
                         st.success("✅ Job description analyzed!")
-                        
+
                         # Display analysis
                         st.info(f"""
-                        **Experience Level:** {analysis['experience_level']}  
-                        **Technical Skills:** {len(analysis['technical_skills'])} found  
-                        **Key Requirements:** {len(analysis['requirements'])} identified
+                  **Experience Level:** {analysis['experience_level']}  
+                  **Technical Skills:** {len(analysis['technical_skills'])} found  
+                  **Key Requirements:** {len(analysis['requirements'])} identified
                         """)
-            else:
-                st.warning("Please enter a job description")
+                else:
+                    st.warning("Please enter a job description")
         
-        st.markdown('</div>', unsafe_allow_html=True)
     
     # Resume Tailoring Section
     if st.session_state.resume_uploaded and job_description:
-        st.markdown('<div class="results-section">', unsafe_allow_html=True)
-        st.header("🎯 AI Resume Tailoring")
+        with st.container(border=True):
+            st.header("🎯 AI Resume Tailoring")
         
-        col1, col2, col3 = st.columns([1, 1, 1])
+            col1, col2, col3 = st.columns([1, 1, 1])
         
-        with col1:
-            if use_rag:
-                button_text = "🧠 RAG-Enhanced Tailoring"
-                spinner_text = "RAG is analyzing and tailoring your resume..."
-            else:
-                button_text = "✨ Standard Tailoring"
-                spinner_text = "AI is tailoring your resume..."
+            with col1:
+                if use_rag:
+                    button_text = "🧠 RAG-Enhanced Tailoring"
+                    spinner_text = "RAG is analyzing and tailoring your resume..."
+                else:
+                    button_text = "✨ Standard Tailoring"
+                    spinner_text = "AI is tailoring your resume..."
                 
-            if st.button(button_text, type="primary", use_container_width=True):
-                with st.spinner(spinner_text):
-                    if use_rag:
-                        result = tailor_resume_with_rag(
-                            st.session_state.session_id, 
-                            job_description, 
-                            tone, 
-                            focus_areas
-                        )
-                    else:
-                        preferences = {
-                            "tone": tone,
-                            "focus_areas": focus_areas
-                        }
-                        result = tailor_resume(st.session_state.session_id, job_description, preferences)
-                    
-                    if result:
-                        st.session_state.tailored_resume = result
-                        if use_rag and result.get('rag_context_summary'):
-                            st.success(f"✅ RAG-Enhanced tailoring completed!")
-                            st.info(f"🔍 Context Used: {result['rag_context_summary']}")
+                if st.button(button_text, type="primary", use_container_width=True):
+                    with st.spinner(spinner_text):
+                        if use_rag:
+                            result = tailor_resume_with_rag(
+                                st.session_state.session_id,
+                                job_description,
+                                tone,
+                                st.session_state.focus_tuple
+                            )
                         else:
-                            st.success("✅ Resume tailored successfully!")
+                            preferences = {
+                                "tone": tone,
+                                "focus_areas": st.session_state.focus_tuple
+                            }
+                            result = tailor_resume(st.session_state.session_id, job_description, preferences)
+                    
+                        if result:
+                            st.session_state.tailored_resume_blob = _pack_result(result)
+                            st.session_state.pop('downloads', None)
+                            _get_files_cached.clear()
+                            _analyze_ats_score_cached.clear()
+                            if use_rag and result.get('rag_context_summary'):
+                                st.success(f"✅ RAG-Enhanced tailoring completed!")
+                                st.info(f"🔍 Context Used: {result['rag_context_summary']}")
+                            else:
+                                st.success("✅ Resume tailored successfully!")
         
-        # 🤖 PREMIUM: Multi-Agent System Row
-        st.markdown("---")
-        st.markdown("### 🤖 **PREMIUM: Multi-Agent System** - *Eliminates Text Jamming Issues*")
-        
-        col_agent = st.columns(1)[0]
-        with col_agent:
-            st.info("🎯 **3 Specialized Agents**: Content Agent, Formatting Agent, Document Agent + Supervisor")
-            if st.button("🤖 Multi-Agent Perfect Formatting", type="primary", use_container_width=True, 
-                        help="Uses 3 specialized agents to ensure perfect formatting and eliminate text jamming"):
-                with st.spinner("🤖 Multi-Agent System is processing your resume..."):
-                    agent_result = tailor_resume_with_agents(
-                        st.session_state.session_id, 
+            # 🤖 PREMIUM: Multi-Agent System Row
+            st.markdown("---")
+            st.markdown("### 🤖 **PREMIUM: Multi-Agent System** - *Eliminates Text Jamming Issues*")
+        
+            col_agent = st.columns(1)[0]
+            with col_agent:
+                st.info("🎯 **3 Specialized Agents**: Content Agent, Formatting Agent, Document Agent + Supervisor")
+                if st.button("🤖 Multi-Agent Perfect Formatting", type="primary", use_container_width=True,
+                            help="Uses 3 specialized agents to ensure perfect formatting and eliminate text jamming"):
+                    # Run the agents on a worker thread so the rest of the page
+                    # (ATS button, sidebar) stays interactive while they work
+                    st.session_state.agent_future = _executor().submit(
+                        _tailor_with_agents_request,
+                        st.session_state.session_id,
                         job_description
                     )
-                    
-                    if agent_result:
-                        st.session_state.tailored_resume = agent_result
-                        st.success("🎉 Multi-Agent System completed successfully!")
-                        st.info(f"🤖 **Agents Used**: {', '.join(agent_result.get('agents_used', []))}")
-                        st.info(f"📝 **Processing Steps**: {len(agent_result.get('processing_messages', []))}")
-                        
-                        # Show improvement notes
-                        if agent_result.get('improvement_notes'):
-                            st.markdown("**✨ Improvements Applied:**")
-                            for note in agent_result['improvement_notes']:
-                                st.markdown(f"- {note}")
 
-        with col2:
-            if st.button("📊 Analyze ATS Score", type="secondary", use_container_width=True):
-                with st.spinner("Analyzing ATS compatibility..."):
-                    ats_result = analyze_ats_score(st.session_state.session_id, job_description)
-                    
-                    if ats_result:
-                        st.session_state.ats_analysis = ats_result
-                        st.success("✅ ATS analysis completed!")
+                agent_future = st.session_state.get('agent_future')
+                if agent_future is not None:
+                    if not agent_future.done():
+                        st.status("🤖 Multi-Agent System is processing your resume...", state="running")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        del st.session_state['agent_future']
+                        agent_result, agent_error = agent_future.result()
+
+                        if agent_result:
+                            st.session_state.tailored_resume_blob = _pack_result(agent_result)
+                            st.session_state.pop('downloads', None)
+                            _get_files_cached.clear()
+                            _analyze_ats_score_cached.clear()
+                            st.success("🎉 Multi-Agent System completed successfully!")
+                            st.info(f"🤖 **Agents Used**: {', '.join(agent_result.get('agents_used', []))}")
+                            st.info(f"📝 **Processing Steps**: {len(agent_result.get('processing_messages', []))}")
+
+                            # Show improvement notes
+                            if agent_result.get('improvement_notes'):
+                                st.markdown("**✨ Improvements Applied:**")
+                                for note in agent_result['improvement_notes']:
+                                    st.markdown(f"- {note}")
+                        else:
+                            st.error(f"❌ Multi-agent tailoring failed: {agent_error}")
+
+            with col2:
+                if st.button("📊 Analyze ATS Score", type="secondary", use_container_width=True):
+                    with st.spinner("Analyzing ATS compatibility..."):
+                        ats_result = analyze_ats_score(st.session_state.session_id, job_description)
+
+                        if ats_result:
+                            st.session_state.ats_analysis = ats_result
+                            st.success("✅ ATS analysis completed!")
+
+            with col3:
+                if st.button("🚀 Optimize Everything", type="secondary", use_container_width=True,
+                            help="Tailor the resume and score ATS compatibility in parallel"):
+                    with st.spinner("Running tailoring and ATS analysis in parallel..."):
+                        tailor_result, ats_result = run_all_optimizations(
+                            st.session_state.session_id,
+                            job_description,
+                            tone,
+                            focus_areas,
+                            use_rag
+                        )
+
+                        if tailor_result:
+                            st.session_state.tailored_resume_blob = _pack_result(tailor_result)
+                            st.session_state.pop('downloads', None)
+                            _get_files_cached.clear()
+                            _analyze_ats_score_cached.clear()
+                        if ats_result:
+                            st.session_state.ats_analysis = ats_result
+                        if tailor_result or ats_result:
+                            st.success("✅ Combined optimization completed!")
         
-        st.markdown('</div>', unsafe_allow_html=True)
     
     # Results Display
-    if st.session_state.tailored_resume:
-        st.markdown('<div class="results-section">', unsafe_allow_html=True)
-        st.header("📋 Tailored Resume")
-        
-        # Improvement metrics
-        metrics = st.session_state.tailored_resume.get('improvement_metrics', {})
-        if metrics:
-            col1, col2, col3, col4 = st.columns(4)
+    if st.session_state.tailored_resume_blob:
+        with st.container(border=True):
+            st.header("📋 Tailored Resume")
+        
+            # Improvement metrics
+            tailored = _unpack_result(st.session_state.tailored_resume_blob)
+            metrics = tailored.get('improvement_metrics', {})
+            if metrics:
+                col1, col2, col3, col4 = st.columns(4)
             
-            with col1:
-                st.metric(
-                    "Original Match",
-                    f"{metrics.get('original_keyword_match', 0):.1f}%"
-                )
+                with col1:
+                    st.metric(
+                        "Original Match",
+                        f"{metrics.get('original_keyword_match', 0):.1f}%"
+                    )
             
-            with col2:
-                st.metric(
-                    "Tailored Match",
-                    f"{metrics.get('tailored_keyword_match', 0):.1f}%"
-                )
+                with col2:
+                    st.metric(
+                        "Tailored Match",
+                        f"{metrics.get('tailored_keyword_match', 0):.1f}%"
+                    )
             
-            with col3:
-                improvement = metrics.get('improvement_percentage', 0)
-                st.metric(
-                    "Improvement",
-                    f"{improvement:+.1f}%",
-                    delta=f"{improvement:.1f}%"
-                )
+                with col3:
+                    improvement = metrics.get('improvement_percentage', 0)
+                    st.metric(
+                        "Improvement",
+                        f"{improvement:+.1f}%",
+                        delta=f"{improvement:.1f}%"
+                    )
             
-            with col4:
-                word_change = metrics.get('word_count_change', 0)
-                tailored_count = metrics.get('tailored_word_count', 0)
-                st.metric(
-                    "Word Count",
-                    tailored_count,
-                    delta=f"{word_change:+d} words" if word_change != 0 else None
-                )
-        
-        # Display tailored resume
-        st.subheader("✨ Tailored Resume Content")
-        st.text_area(
-            "Your AI-optimized resume:",
-            st.session_state.tailored_resume['tailored_resume'],
-            height=400,
-            disabled=True
-        )
-        
-        # File Generation Section (after multi-agent output)
-        st.subheader("📄 Generate Downloadable Files")
-        col1, col2, col3 = st.columns([1, 1, 1])
+                with col4:
+                    word_change = metrics.get('word_count_change', 0)
+                    tailored_count = metrics.get('tailored_word_count', 0)
+                    st.metric(
+                        "Word Count",
+                        tailored_count,
+                        delta=f"{word_change:+d} words" if word_change != 0 else None
+                    )
         
-        with col1:
-            file_format = st.selectbox(
-                "File Format:",
-                ["both", "pdf", "docx"],
-                format_func=lambda x: {"both": "📄 PDF + DOCX", "pdf": "📄 PDF Only", "docx": "📄 DOCX Only"}[x]
+            # Display tailored resume
+            st.subheader("✨ Tailored Resume Content")
+            st.text_area(
+                "Your AI-optimized resume:",
+                tailored['tailored_resume'],
+                height=400,
+                disabled=True
             )
         
-        with col2:
-            resume_style = st.selectbox(
-                "Style:",
-                ["modern", "classic", "professional"],
-                format_func=lambda x: {"modern": "🔥 Modern", "classic": "📜 Classic", "professional": "💼 Professional"}[x]
-            )
+            # File Generation Section (after multi-agent output)
+            st.subheader("📄 Generate Downloadable Files")
+            col1, col2, col3 = st.columns([1, 1, 1])
         
-        with col3:
-            if st.button("📥 Generate Files", type="primary", use_container_width=True):
-                with st.spinner("Generating downloadable files..."):
-                    file_result = generate_files(
-                        st.session_state.session_id,
-                        file_format,
-                        resume_style
-                    )
-                    
-                    if file_result:
-                        st.success("✅ Files generated successfully!")
-                        st.session_state.files_generated = True
-        
-        # Download buttons (only show after files are generated)
-        if hasattr(st.session_state, 'files_generated') and st.session_state.files_generated:
-            st.subheader("💾 Download Your Resume")
-            col1, col2 = st.columns(2)
-            
             with col1:
-                if st.button("📄 Download PDF", use_container_width=True):
-                    pdf_content = download_file(st.session_state.session_id, "pdf")
-                    if pdf_content:
-                        st.download_button(
-                            label="💾 Download PDF",
-                            data=pdf_content,
-                            file_name=f"tailored_resume_{datetime.now().strftime('%Y%m%d')}.pdf",
-                            mime="application/pdf",
-                            use_container_width=True
-                        )
-            
-            with col2:
-                if st.button("📄 Download DOCX", use_container_width=True):
-                    docx_content = download_file(st.session_state.session_id, "docx")
-                    if docx_content:
-                        st.download_button(
-                            label="💾 Download DOCX",
-                            data=docx_content,
-                            file_name=f"tailored_resume_{datetime.now().strftime('%Y%m%d')}.docx",
-                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            use_container_width=True
-                        )
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # ATS Analysis Results
-    if st.session_state.ats_analysis:
-        st.markdown('<div class="results-section">', unsafe_allow_html=True)
-        st.header("🎯 ATS Compatibility Analysis")
-        
-        ats = st.session_state.ats_analysis
-        
-        # Score display
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        scores = [
-            ("Overall", ats.get('overall_score', 0)),
-            ("Keywords", ats.get('keyword_score', 0)),
-            ("Structure", ats.get('structure_score', 0)),
-            ("Skills", ats.get('skills_score', 0)),
-            ("Experience", ats.get('experience_score', 0))
-        ]
-        
-        for i, (label, score) in enumerate(scores):
-            with [col1, col2, col3, col4, col5][i]:
-                # Color based on score
-                if score >= 80:
-                    color = "green"
-                elif score >= 60:
-                    color = "orange"
-                else:
-                    color = "red"
-                
-                st.metric(
-                    label,
-                    f"{score:.0f}%",
-                    delta=None
+                file_format = st.selectbox(
+                    "File Format:",
+                    ["both", "pdf", "docx"],
+                    format_func=_FORMAT_LABELS.__getitem__
                 )
         
-        # Detailed analysis
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("✅ Matched Keywords")
-            matched = ats.get('matched_keywords', [])
-            if matched:
-                for keyword in matched[:10]:  # Show top 10
-                    st.write(f"• {keyword}")
-            else:
-                st.write("No matched keywords found")
+            with col2:
+                resume_style = st.selectbox(
+                    "Style:",
+                    ["modern", "classic", "professional"],
+                    format_func=_STYLE_LABELS.__getitem__
+                )
         
-        with col2:
-            st.subheader("❌ Missing Keywords")
-            missing = ats.get('missing_keywords', [])
-            if missing:
-                for keyword in missing[:10]:  # Show top 10
-                    st.write(f"• {keyword}")
-            else:
-                st.write("No missing keywords identified")
+            with col3:
+                if st.button("📥 Generate Files", type="primary", use_container_width=True):
+                    gen_key = (st.session_state.session_id, file_format, resume_style)
+                    if st.session_state.get('_last_gen_key') == gen_key and st.session_state.get('downloads'):
+                        # Repeat click with identical settings: the bytes
+                        # are already in session state, skip straight past
+                        # the spinner
+                        st.info("🔄 Using cached files")
+                    else:
+                        with st.spinner("Generating downloadable files..."):
+                            files = _get_files(
+                                st.session_state.session_id,
+                                file_format,
+                                resume_style
+                            )
+
+                            if files:
+                                st.success("✅ Files generated successfully!")
+                                st.session_state.files_generated = True
+                                st.session_state.downloads = files
+                                st.session_state._last_gen_key = gen_key
         
-        # Recommendations
-        recommendations = ats.get('recommendations', [])
-        if recommendations:
-            st.subheader("💡 Recommendations")
-            for i, rec in enumerate(recommendations[:5], 1):
-                st.write(f"{i}. {rec}")
+            # Download buttons (only show after files are generated). Direct
+            # download_buttons over the in-memory bytes: one click, no extra
+            # rerun or re-fetch. The placeholder reserves the spot in the
+            # layout so the panel swaps in place instead of reflowing the
+            # page when files appear
+            dl_slot = st.empty()
+            if st.session_state.get('files_generated'):
+                with dl_slot.container():
+                    st.subheader("💾 Download Your Resume")
+                    downloads = st.session_state.get('downloads', {})
+                    # Tabs mount only the visible pane, so only one download
+                    # payload is serialized to the browser at a time
+                    pdf_tab, docx_tab = st.tabs(["📄 PDF", "📄 DOCX"])
+
+                    with pdf_tab:
+                        if downloads.get('pdf'):
+                            st.download_button(
+                                label="💾 Download PDF",
+                                data=downloads['pdf'],
+                                file_name=f"tailored_resume_{_today_str()}.pdf",
+                                mime="application/pdf",
+                                use_container_width=True
+                            )
+
+                    with docx_tab:
+                        if downloads.get('docx'):
+                            st.download_button(
+                                label="💾 Download DOCX",
+                                data=downloads['docx'],
+                                file_name=f"tailored_resume_{_today_str()}.docx",
+                                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                                use_container_width=True
+                            )
         
-        st.markdown('</div>', unsafe_allow_html=True)
     
+    # ATS Analysis Results
+    if st.session_state.ats_analysis:
+        render_ats_panel(st.session_state.ats_analysis)
+
     # Job Analysis Display
     if st.session_state.job_analysis:
-        with st.expander("📊 Job Description Analysis"):
-            analysis = st.session_state.job_analysis
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("🔧 Technical Skills Required")
-                tech_skills = analysis.get('technical_skills', [])
-                if tech_skills:
-                    for skill in tech_skills[:15]:
-                        st.write(f"• {skill}")
-                else:
-                    st.write("No technical skills identified")
-            
-            with col2:
-                st.subheader("🤝 Soft Skills Required")
-                soft_skills = analysis.get('soft_skills', [])
-                if soft_skills:
-                    for skill in soft_skills[:10]:
-                        st.write(f"• {skill}")
-                else:
-                    st.write("No soft skills identified")
-            
-            st.subheader("📋 Key Requirements")
-            requirements = analysis.get('requirements', [])
-            if requirements:
-                for req in requirements[:10]:
-                    st.write(f"• {req}")
-            else:
-                st.write("No specific requirements identified")
+        render_job_analysis(st.session_state.job_analysis)
     
     # Footer
     st.markdown("---")
-    st.markdown(
-        '<p style="text-align: center; color: #7f8c8d;">🚀 ZubeResume AI - Powered by Groq (FREE!)</p>',
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file